@@ -1,27 +1,49 @@
 """Main API handler coordinating all API-related operations."""
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, cast
+from concurrent.futures import ThreadPoolExecutor
+import os
 import traceback
-from PyQt6.QtCore import QObject
+import uuid
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
 
 from .client import ReplicateClient
 from .prediction_manager import PredictionManager
 from ..core.models.generation import Generation, GenerationStatus
 from ..core.models.order import Order, OrderStatus
-from ..core.models.product import Product, ProductType
+from ..core.models.product import ProductType
 from ..core.events.order_events import OrderEvent, OrderEventType, OrderEventPublisher
 from ..core.events.generation_events import GenerationEvent, GenerationEventType, GenerationEventPublisher
 from ..core.events.product_events import ProductEvent, ProductEventType, ProductEventPublisher
 from ..data.repositories.order_repository import OrderRepository
 from ..data.repositories.generation_repository import GenerationRepository
 from ..data.repositories.product_repository import ProductRepository
+from ..data.write_queue import WriteQueue
 from ..utils.debug_logger import LogManager
+from ..utils.image_probe import PNG_HEADER_SIZE, probe_image, probe_png_header
 
 logger = LogManager.get_logger(__name__)
 
 class APIHandler(QObject):
     """Coordinates API operations and manages state."""
     
+    generation_progress = pyqtSignal(str, int)  # prediction_id, percent complete
+    _outputs_saved = pyqtSignal(str, list)  # prediction_id, product rows
+    _prediction_created = pyqtSignal(object, object)  # order request, prediction
+    _prediction_failed = pyqtSignal(object, str)  # order request, error message
+    
+    # Most outputs of one generation downloaded at the same time
+    MAX_PARALLEL_DOWNLOADS = 4
+    # Bytes written to disk per chunk while downloading an output
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+    # Seconds to wait for an output server to respond
+    DOWNLOAD_TIMEOUT = 30
+    # Retries of a download answered with a transient gateway error
+    DOWNLOAD_RETRIES = 3
+    
     def __init__(self, 
                 order_repository: Optional[OrderRepository] = None,
                 generation_repository: Optional[GenerationRepository] = None,
@@ -35,7 +57,33 @@ class APIHandler(QObject):
         
         self._init_components()
         self._connect_signals()
-        self._active_predictions = set()
+        # Active predictions and their generation records, once known
+        self._active_predictions: Dict[str, Optional[Generation]] = {}
+        # Status updates are applied off the GUI thread; nothing waits on them
+        self._writes = WriteQueue()
+        # Shared by download workers, so connections to the output host are reused
+        self._http = self._create_http_session()
+        self._output_dir = Path.home() / '.imagen-desktop' / 'products'
+    
+    def _create_http_session(self) -> requests.Session:
+        """Create the session used to download outputs.
+        
+        Its pool keeps a connection per concurrent download, and requests
+        failing with a transient gateway error are retried with backoff.
+        """
+        retry = Retry(
+            total=self.DOWNLOAD_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504)
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=self.MAX_PARALLEL_DOWNLOADS,
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
     
     def _init_components(self):
         """Initialize API components."""
@@ -48,15 +96,23 @@ class APIHandler(QObject):
         self.prediction_manager.generation_completed.connect(self._handle_generation_completed)
         self.prediction_manager.generation_failed.connect(self._handle_generation_failed)
         self.prediction_manager.generation_canceled.connect(self._handle_generation_canceled)
+        self.prediction_manager.generation_progress.connect(self.generation_progress)
+        self._outputs_saved.connect(self._finish_generation_completed)
+        self._prediction_created.connect(self._start_order_generation)
+        self._prediction_failed.connect(self._fail_order)
     
     def create_order(self, 
                     model: str, 
                     prompt: str,
                     parameters: Dict[str, Any],
-                    project_id: Optional[int] = None) -> Tuple[Optional[Order], str]:
+                    project_id: Optional[int] = None) -> Tuple[Optional[Order], Optional[str]]:
         """
         Create a new order and start the first generation.
         
+        The prediction is created in the background; the generation is
+        announced by a STARTED generation event, or the order by a FAILED
+        order event if the prediction could not be created.
+        
         Args:
             model: Model identifier
             prompt: Text prompt
@@ -64,7 +120,7 @@ class APIHandler(QObject):
             project_id: Optional project ID
             
         Returns:
-            Tuple of (Order, prediction_id) or (None, error_message)
+            Tuple of (Order, None) or (None, error_message)
         """
         try:
             # Validate repositories
@@ -97,16 +153,49 @@ class APIHandler(QObject):
                 stack_trace = traceback.format_exc()
                 logger.error(f"Error publishing order event: {e}\n{stack_trace}")
             
-            # Start generation (using same parameters as order)
-            prediction_id = self.prediction_manager.start_prediction(model, parameters)
+            # Creating the prediction is an HTTP round trip, so it runs on a
+            # worker; the generation is recorded once it is back on this thread
+            request = {
+                'order': order,
+                'model': model,
+                'prompt': prompt,
+                'parameters': parameters
+            }
+            cast(QThreadPool, QThreadPool.globalInstance()).start(
+                lambda: self._create_prediction(request)
+            )
+            
+            return order, None
+            
+        except Exception as e:
+            stack_trace = traceback.format_exc()
+            logger.error(f"Failed to create order: {e}\n{stack_trace}")
+            return None, str(e)
+    
+    def _create_prediction(self, request: Dict[str, Any]):
+        """Create the prediction for an order request on a worker thread."""
+        try:
+            prediction = self.prediction_manager.create_prediction(
+                request['model'], request['parameters']
+            )
+        except Exception as e:
+            self._prediction_failed.emit(request, str(e))
+            return
+        self._prediction_created.emit(request, prediction)
+    
+    def _start_order_generation(self, request: Dict[str, Any], prediction: Any):
+        """Start polling a created prediction and record its generation."""
+        order = request['order']
+        try:
+            prediction_id = self.prediction_manager.track_prediction(prediction)
             
             # Create generation record
             generation = self.generation_repository.create_generation(
                 prediction_id=prediction_id,
                 order_id=order.id,
-                model=model,
-                prompt=prompt,
-                parameters=parameters,
+                model=request['model'],
+                prompt=request['prompt'],
+                parameters=request['parameters'],
                 status=GenerationStatus.STARTING
             )
             
@@ -125,7 +214,8 @@ class APIHandler(QObject):
                     logger.error(f"Error publishing generation event: {e}\n{stack_trace}")
             
             # Update order status
-            self.order_repository.update_order_status(
+            self._writes.submit(
+                self.order_repository.update_order_status,
                 order_id=order.id,
                 status=OrderStatus.PROCESSING
             )
@@ -142,27 +232,48 @@ class APIHandler(QObject):
                 logger.error(f"Error publishing order status event: {e}\n{stack_trace}")
             
             # Track active prediction
-            self._active_predictions.add(prediction_id)
+            self._active_predictions[prediction_id] = generation
             
             logger.info(
                 f"Created order {order.id} with generation {prediction_id}",
-                extra={'context': {'model': model}}
+                extra={'context': {'model': request['model']}}
             )
             
-            return order, prediction_id
-            
         except Exception as e:
             stack_trace = traceback.format_exc()
-            logger.error(f"Failed to create order: {e}\n{stack_trace}")
-            return None, str(e)
+            logger.error(f"Failed to start generation for order {order.id}: {e}\n{stack_trace}")
+    
+    def _fail_order(self, request: Dict[str, Any], error: str):
+        """Mark an order failed when its prediction could not be created."""
+        order = request['order']
+        logger.error(f"Failed to start prediction for order {order.id}: {error}")
+        
+        if self.order_repository:
+            self._writes.submit(
+                self.order_repository.update_order_status,
+                order_id=order.id,
+                status=OrderStatus.FAILED
+            )
+        
+        try:
+            # Publish order failed event
+            order_event = OrderEvent(
+                event_type=OrderEventType.FAILED,
+                order=order,
+                error=error
+            )
+            OrderEventPublisher.publish_order_event(order_event)
+        except Exception as e:
+            stack_trace = traceback.format_exc()
+            logger.error(f"Error publishing order failed event: {e}\n{stack_trace}")
     
     def notify_generation_started(self, prediction_id: str):
         """Notify listeners that generation has started."""
         if prediction_id in self._active_predictions:
-            logger.debug(f"Notifying generation started: {prediction_id}")
+            logger.debug("Notifying generation started: %s", prediction_id)
             
             if self.generation_repository:
-                generation = self.generation_repository.get_generation(prediction_id)
+                generation = self._get_generation(prediction_id)
                 if generation:
                     try:
                         generation_event = GenerationEvent(
@@ -174,8 +285,30 @@ class APIHandler(QObject):
                         stack_trace = traceback.format_exc()
                         logger.error(f"Error publishing generation started event: {e}\n{stack_trace}")
     
+    def _get_generation(self, prediction_id: str) -> Optional[Generation]:
+        """Get the generation record for a prediction.
+        
+        Records are kept in memory while the prediction is active, so
+        status handlers query the database at most once per prediction.
+        """
+        generation = self._active_predictions.get(prediction_id)
+        if generation is None and self.generation_repository:
+            generation = self.generation_repository.get_generation(prediction_id)
+            if generation is not None and prediction_id in self._active_predictions:
+                self._active_predictions[prediction_id] = generation
+        return generation
+    
+    def _forget_prediction(self, prediction_id: str):
+        """Stop tracking a finished prediction."""
+        self._active_predictions.pop(prediction_id, None)
+    
     def _handle_generation_completed(self, prediction_id: str, raw_outputs: list):
-        """Handle completed generation and emit products."""
+        """Handle completed generation and emit products.
+        
+        Downloading the outputs runs on a thread pool worker; records and
+        events are handled by _finish_generation_completed once the files
+        are saved, back on this object's thread.
+        """
         if prediction_id not in self._active_predictions:
             logger.warning(f"Received completion for unknown generation: {prediction_id}")
             return
@@ -190,22 +323,53 @@ class APIHandler(QObject):
             }
         )
         
+        if not self.product_repository:
+            self._finish_generation_completed(prediction_id, [])
+            return
+        
+        cast(QThreadPool, QThreadPool.globalInstance()).start(
+            lambda: self._save_outputs(prediction_id, raw_outputs)
+        )
+    
+    def _save_outputs(self, prediction_id: str, raw_outputs: list):
+        """Save all outputs of a generation and report the product rows.
+        
+        Outputs are downloaded concurrently; rows keep the output order.
+        """
+        rows = []
+        if raw_outputs:
+            try:
+                self._output_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.error(f"Failed to create output directory {self._output_dir}: {e}")
+            workers = min(len(raw_outputs), self.MAX_PARALLEL_DOWNLOADS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                saved = executor.map(
+                    lambda output: self._save_output(output, prediction_id),
+                    raw_outputs
+                )
+                rows = [row for row in saved if row]
+        self._outputs_saved.emit(prediction_id, rows)
+    
+    def _finish_generation_completed(self, prediction_id: str, rows: List[Dict[str, Any]]):
+        """Record the products of a completed generation and publish events."""
+        if prediction_id not in self._active_predictions:
+            return
+        
         # Get generation details
         generation = None
         if self.generation_repository:
-            generation = self.generation_repository.get_generation(prediction_id)
+            generation = self._get_generation(prediction_id)
         
-        # Process outputs into products
+        # Process outputs into products with a single insert
         products = []
-        if self.product_repository:
-            for output in raw_outputs:
-                product = self._create_product_from_output(output, prediction_id)
-                if product:
-                    products.append(product)
+        if rows and self.product_repository:
+            products = self.product_repository.create_products(rows)
         
         # Update generation status
         if generation and self.generation_repository:
-            self.generation_repository.update_generation_status(
+            self._writes.submit(
+                self.generation_repository.update_generation_status,
                 prediction_id=prediction_id,
                 status=GenerationStatus.COMPLETED
             )
@@ -229,8 +393,10 @@ class APIHandler(QObject):
                     order_id=generation.order_id
                 )
                 
+                # This generation's own status update may still be queued
                 all_complete = all(
                     g.status in (GenerationStatus.COMPLETED, GenerationStatus.FAILED)
+                    or g.id == prediction_id
                     for g in generations
                 )
                 
@@ -238,7 +404,8 @@ class APIHandler(QObject):
                     # Get updated order
                     order = self.order_repository.get_order(generation.order_id)
                     if order:
-                        self.order_repository.update_order_status(
+                        self._writes.submit(
+                            self.order_repository.update_order_status,
                             order_id=generation.order_id,
                             status=OrderStatus.FULFILLED
                         )
@@ -254,81 +421,91 @@ class APIHandler(QObject):
                             stack_trace = traceback.format_exc()
                             logger.error(f"Error publishing order fulfilled event: {e}\n{stack_trace}")
         
-        self._active_predictions.remove(prediction_id)
+        self._forget_prediction(prediction_id)
     
-    def _create_product_from_output(self, output: Any, generation_id: str) -> Optional[Product]:
+    def _save_output(self, output: Any, generation_id: str) -> Optional[Dict[str, Any]]:
         """
-        Create a product from generation output.
+        Save generation output to disk and describe the product to create.
         
         Args:
             output: Raw output from generation
             generation_id: ID of the generation that produced this output
             
         Returns:
-            Product or None if creation failed
+            Product fields for the repository, or None if saving failed
         """
         try:
-            if not self.product_repository:
-                logger.warning("Product repository not available")
-                return None
-                
-            # Save output to file
-            output_dir = Path.home() / '.imagen-desktop' / 'products'
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Handle FileOutput objects from Replicate
-            if hasattr(output, 'read'):
-                data = output.read()
-            elif hasattr(output, 'url'):
-                # Download from URL
-                import requests
-                response = requests.get(output.url)
-                response.raise_for_status()
-                data = response.content
-            else:
-                # Assume string URL
-                import requests
-                response = requests.get(str(output))
-                response.raise_for_status()
-                data = response.content
-            
-            # Save to unique file
-            import uuid
-            file_path = output_dir / f"{uuid.uuid4()}.png"
-            with open(file_path, 'wb') as f:
-                f.write(data)
-            
-            # Get image dimensions
-            width = None
-            height = None
-            format_name = None
+            # Stream to a unique file, so the image is never held in memory
+            # whole. It is written under a temporary name and renamed into
+            # place, so a crash mid-download never leaves a truncated .png
+            name = uuid.uuid4().hex
+            file_path = self._output_dir / f"{name}.png"
+            tmp_path = self._output_dir / f"{name}.png.part"
             try:
-                from PIL import Image
-                with Image.open(file_path) as img:
-                    width, height = img.size
-                    format_name = img.format.lower() if img.format else None
-            except Exception as e:
-                logger.warning(f"Failed to get image dimensions: {e}")
+                with open(tmp_path, 'wb') as f:
+                    if hasattr(output, 'read'):
+                        # FileOutput objects from Replicate
+                        head = self._copy_output(output, f)
+                    else:
+                        # FileOutput without a body, or a plain URL string
+                        url = output.url if hasattr(output, 'url') else str(output)
+                        head = self._download(url, f)
+                os.replace(tmp_path, file_path)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
             
-            # Create product record
-            product = self.product_repository.create_product(
-                file_path=file_path,
-                generation_id=generation_id,
-                width=width,
-                height=height,
-                format=format_name,
-                product_type=ProductType.IMAGE
-            )
-            
-            # Note: ProductEventPublisher is already called inside the repository's create_product method
+            # Get image dimensions from the bytes seen while writing; only
+            # formats other than PNG need the file read back
+            meta = probe_png_header(head) or probe_image(file_path)
             
-            return product
+            return {
+                'file_path': file_path,
+                'generation_id': generation_id,
+                'width': meta.width,
+                'height': meta.height,
+                'format': meta.format,
+                'product_type': ProductType.IMAGE
+            }
             
         except Exception as e:
             stack_trace = traceback.format_exc()
-            logger.error(f"Failed to create product: {e}\n{stack_trace}")
+            logger.error(f"Failed to save output: {e}\n{stack_trace}")
             return None
     
+    def _write_chunks(self, chunks, f) -> bytes:
+        """Write chunks to an open file and return the first bytes written."""
+        head = b''
+        for chunk in chunks:
+            if len(head) < PNG_HEADER_SIZE:
+                head += chunk[:PNG_HEADER_SIZE - len(head)]
+            f.write(chunk)
+        return head
+    
+    def _copy_output(self, output: Any, f) -> bytes:
+        """Write a file-like output to an open file in chunks.
+        
+        Returns:
+            The first bytes of the output
+        """
+        if hasattr(output, '__iter__'):
+            return self._write_chunks(output, f)
+        data = output.read()
+        f.write(data)
+        return data[:PNG_HEADER_SIZE]
+    
+    def _download(self, url: str, f) -> bytes:
+        """Stream a URL's body to an open file.
+        
+        Returns:
+            The first bytes of the body
+        """
+        with self._http.get(url, stream=True, timeout=self.DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            return self._write_chunks(
+                response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE), f
+            )
+    
     def _handle_generation_failed(self, prediction_id: str, error: str):
         """Handle generation failure."""
         if prediction_id in self._active_predictions:
@@ -344,10 +521,11 @@ class APIHandler(QObject):
             
             # Update generation status
             if self.generation_repository:
-                generation = self.generation_repository.get_generation(prediction_id)
+                generation = self._get_generation(prediction_id)
                 
                 if generation:
-                    self.generation_repository.update_generation_status(
+                    self._writes.submit(
+                        self.generation_repository.update_generation_status,
                         prediction_id=prediction_id,
                         status=GenerationStatus.FAILED,
                         error=error
@@ -370,7 +548,8 @@ class APIHandler(QObject):
                         # Get updated order
                         order = self.order_repository.get_order(generation.order_id)
                         if order:
-                            self.order_repository.update_order_status(
+                            self._writes.submit(
+                                self.order_repository.update_order_status,
                                 order_id=generation.order_id,
                                 status=OrderStatus.FAILED
                             )
@@ -387,7 +566,7 @@ class APIHandler(QObject):
                                 stack_trace = traceback.format_exc()
                                 logger.error(f"Error publishing order failed event: {e}\n{stack_trace}")
             
-            self._active_predictions.remove(prediction_id)
+            self._forget_prediction(prediction_id)
     
     def _handle_generation_canceled(self, prediction_id: str):
         """Handle generation cancellation."""
@@ -396,10 +575,11 @@ class APIHandler(QObject):
             
             # Update generation status
             if self.generation_repository:
-                generation = self.generation_repository.get_generation(prediction_id)
+                generation = self._get_generation(prediction_id)
                 
                 if generation:
-                    self.generation_repository.update_generation_status(
+                    self._writes.submit(
+                        self.generation_repository.update_generation_status,
                         prediction_id=prediction_id,
                         status=GenerationStatus.CANCELLED
                     )
@@ -420,7 +600,8 @@ class APIHandler(QObject):
                         # Get updated order
                         order = self.order_repository.get_order(generation.order_id)
                         if order:
-                            self.order_repository.update_order_status(
+                            self._writes.submit(
+                                self.order_repository.update_order_status,
                                 order_id=generation.order_id,
                                 status=OrderStatus.CANCELED
                             )
@@ -436,7 +617,12 @@ class APIHandler(QObject):
                                 stack_trace = traceback.format_exc()
                                 logger.error(f"Error publishing order canceled event: {e}\n{stack_trace}")
             
-            self._active_predictions.remove(prediction_id)
+            self._forget_prediction(prediction_id)
+    
+    def close(self):
+        """Apply outstanding status updates and release connections on exit."""
+        self._writes.close()
+        self._http.close()
     
     def cancel_generation(self, prediction_id: str):
         """Cancel an ongoing generation."""
@@ -2,7 +2,7 @@
 import threading
 import time
 import traceback
-from typing import Any, List
+from typing import Any, List, Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 from ..utils.debug_logger import logger
 from .client import ReplicateClient
@@ -33,11 +33,25 @@ class PredictionManager(QObject):
         else:
             return [str(output)]
     
+    @staticmethod
+    def _progress_percent(prediction: Any) -> Optional[int]:
+        """Get how far a running prediction is, parsed from its logs.
+        
+        Returns:
+            Percent complete, or None if the model doesn't report progress
+        """
+        progress = getattr(prediction, 'progress', None)
+        percentage = getattr(progress, 'percentage', None)
+        if not isinstance(percentage, (int, float)):
+            return None
+        return max(0, min(100, int(percentage * 100)))
+    
     def _poll_prediction(self, prediction_id: str):
         """Poll prediction status until completion."""
         try:
             max_attempts = 60  # Maximum polling attempts (60 seconds)
             attempt = 0
+            last_progress = None
             
             while prediction_id in self._active_predictions and attempt < max_attempts:
                 try:
@@ -58,6 +72,11 @@ class PredictionManager(QObject):
                         self.generation_canceled.emit(prediction_id)
                         break
                     
+                    progress = self._progress_percent(prediction)
+                    if progress is not None and progress != last_progress:
+                        self.generation_progress.emit(prediction_id, progress)
+                        last_progress = progress
+                    
                     # Wait before next poll
                     time.sleep(1)
                     attempt += 1
@@ -84,31 +103,44 @@ class PredictionManager(QObject):
             if prediction_id in self._active_predictions:
                 del self._active_predictions[prediction_id]
     
+    def create_prediction(self, model_identifier: str, params: dict) -> Any:
+        """
+        Create a prediction without tracking it.
+        Makes no Qt calls, so it can run on a worker thread.
+        """
+        logger.debug("Starting prediction for model %s", model_identifier)
+        return self.client.create_prediction(model_identifier, **params)
+    
+    def track_prediction(self, prediction: Any) -> str:
+        """
+        Start polling a created prediction.
+        Returns the prediction ID.
+        """
+        # Store thread for cancellation
+        thread = threading.Thread(
+            target=self._poll_prediction,
+            args=(prediction.id,),
+            daemon=True
+        )
+        self._active_predictions[prediction.id] = {
+            'thread': thread,
+            'prediction': prediction
+        }
+        
+        # Start polling
+        thread.start()
+        self.generation_started.emit(prediction.id)
+        
+        return prediction.id
+    
     def start_prediction(self, model_identifier: str, params: dict) -> str:
         """
         Start a new prediction.
         Returns the prediction ID.
         """
         try:
-            logger.debug(f"Starting prediction for model {model_identifier}")
-            prediction = self.client.create_prediction(model_identifier, **params)
-            
-            # Store thread for cancellation
-            thread = threading.Thread(
-                target=self._poll_prediction,
-                args=(prediction.id,),
-                daemon=True
-            )
-            self._active_predictions[prediction.id] = {
-                'thread': thread,
-                'prediction': prediction
-            }
-            
-            # Start polling
-            thread.start()
-            self.generation_started.emit(prediction.id)
-            
-            return prediction.id
+            prediction = self.create_prediction(model_identifier, params)
+            return self.track_prediction(prediction)
             
         except Exception as e:
             stack_trace = traceback.format_exc()
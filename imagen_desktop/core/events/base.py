@@ -79,7 +79,7 @@ class EventPublisher:
         """Publish an event to all subscribers."""
         event_type = event.event_type
         if event_type not in cls._subscribers:
-            logger.debug(f"No subscribers for event type: {event_type}")
+            logger.debug("No subscribers for event type: %s", event_type)
             return
             
         # Get the event class name for filtering
@@ -135,4 +135,4 @@ class EventPublisher:
         """Clear all subscribers for an event type."""
         if event_type in cls._subscribers:
             cls._subscribers[event_type].clear()
-            logger.debug(f"Cleared all subscribers for {event_type}")
\ No newline at end of file
+            logger.debug("Cleared all subscribers for %s", event_type)
\ No newline at end of file
@@ -8,15 +8,29 @@ from alembic.script import ScriptDirectory
 from alembic.runtime.migration import MigrationContext
 from alembic.util.exc import CommandError
 
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 
 from imagen_desktop.utils.debug_logger import logger
 
 class Database:
     """Central database management for the application."""
     
+    # Connections kept open for the GUI thread, database writer and pool workers
+    POOL_SIZE = 5
+    POOL_MAX_OVERFLOW = 10
+    # Seconds a connection waits on another thread's write lock
+    BUSY_TIMEOUT = 30
+    # Applied to every new connection: WAL lets readers run alongside the
+    # writer, and NORMAL sync is durable across application crashes in WAL
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+    )
+    
     def __init__(self, path: Path):
         """Initialize database with path.
         
@@ -36,9 +50,21 @@ class Database:
             db_url = f"sqlite:///{self.path}"
             logger.debug(f"Initializing database with URL: {db_url}")
             
-            # Create engine
-            self.engine = create_engine(db_url)
-            self._session_factory = sessionmaker(bind=self.engine)
+            # Create engine; pooled connections are shared across threads
+            self.engine = create_engine(
+                db_url,
+                poolclass=QueuePool,
+                pool_size=self.POOL_SIZE,
+                max_overflow=self.POOL_MAX_OVERFLOW,
+                connect_args={
+                    'check_same_thread': False,
+                    'timeout': self.BUSY_TIMEOUT
+                }
+            )
+            event.listen(self.engine, 'connect', self._configure_connection)
+            # Repositories convert rows before returning them, so committed
+            # rows need not be reloaded
+            self._session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
             
             # Run migrations if needed
             self._run_migrations()
@@ -60,6 +86,22 @@ class Database:
             raise RuntimeError("Database not initialized")
         return self._session_factory()
     
+    @classmethod
+    def _configure_connection(cls, dbapi_connection, connection_record) -> None:
+        """Apply the SQLite PRAGMAs to a new DBAPI connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in cls.SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+    
+    def close(self) -> None:
+        """Close the pooled connections."""
+        if self.engine is not None:
+            self.engine.dispose()
+            logger.debug("Database connections closed")
+    
     def _get_migration_files(self) -> List[str]:
         """Get list of available migration files."""
         migrations_dir = Path(__file__).parent / 'migrations' / 'versions'
@@ -1,14 +1,15 @@
 """Repository for generation management."""
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, cast
 
-from sqlalchemy import desc
+from sqlalchemy import CursorResult, desc, update
 from sqlalchemy.orm import joinedload
 
 from imagen_desktop.data.repositories.base_repository import BaseRepository
 from imagen_desktop.data.schema import Generation as GenerationModel
 from imagen_desktop.data.schema import Product as ProductModel
 from imagen_desktop.core.models.generation import Generation, GenerationStatus
+from imagen_desktop.core.models.product import Product as ProdDomain
 from imagen_desktop.utils.debug_logger import LogManager
 
 logger = LogManager.get_logger(__name__)
@@ -50,7 +51,7 @@ class GenerationRepository(BaseRepository):
             
             result = self.add(generation_model)
             if result:
-                logger.debug(f"Created generation {prediction_id} with status {status.value}")
+                logger.debug("Created generation %s with status %s", prediction_id, status.value)
                 return Generation.from_db_model(result)
             
             logger.error(f"Failed to create generation {prediction_id}")
@@ -104,7 +105,6 @@ class GenerationRepository(BaseRepository):
                 # Extract products
                 products = []
                 for prod_model in generation_model.products:
-                    from imagen_desktop.core.models.product import Product as ProdDomain
                     prod = ProdDomain.from_db_model(prod_model)
                     products.append(prod)
                 
@@ -133,17 +133,21 @@ class GenerationRepository(BaseRepository):
             True if update was successful
         """
         try:
+            values = {'status': status.value}
+            if error:
+                values['error'] = error
+            
             with self._get_session() as session:
-                generation_model = session.query(GenerationModel)\
-                    .filter(GenerationModel.id == prediction_id)\
-                    .first()
+                # A single UPDATE; the row needn't be loaded first
+                result = cast(CursorResult, session.execute(
+                    update(GenerationModel)
+                    .where(GenerationModel.id == prediction_id)
+                    .values(**values)
+                ))
+                session.commit()
                 
-                if generation_model:
-                    generation_model.status = status.value
-                    if error:
-                        generation_model.error = error
-                    session.commit()
-                    logger.debug(f"Updated generation {prediction_id} status to {status.value}")
+                if result.rowcount:
+                    logger.debug("Updated generation %s status to %s", prediction_id, status.value)
                     return True
                 
                 logger.warning(f"Generation {prediction_id} not found for status update")
@@ -175,7 +179,7 @@ class GenerationRepository(BaseRepository):
                 if generation_model:
                     generation_model.return_parameters = return_parameters
                     session.commit()
-                    logger.debug(f"Updated return parameters for generation {prediction_id}")
+                    logger.debug("Updated return parameters for generation %s", prediction_id)
                     return True
                 
                 logger.warning(f"Generation {prediction_id} not found for parameter update")
@@ -210,7 +214,7 @@ class GenerationRepository(BaseRepository):
                 generation_models = query.all()
                 
                 generations = [Generation.from_db_model(model) for model in generation_models]
-                logger.debug(f"Retrieved {len(generations)} generations for order {order_id}")
+                logger.debug("Retrieved %s generations for order %s", len(generations), order_id)
                 return generations
                 
         except Exception as e:
@@ -249,7 +253,7 @@ class GenerationRepository(BaseRepository):
                 # Convert to domain models
                 generations = [Generation.from_db_model(model) for model in generation_models]
                 
-                logger.debug(f"Retrieved {len(generations)} generations")
+                logger.debug("Retrieved %s generations", len(generations))
                 return generations
                 
         except Exception as e:
@@ -277,7 +281,7 @@ class GenerationRepository(BaseRepository):
                 for status, count in counts:
                     result[status] = count
                 
-                logger.debug(f"Generation counts by status: {result}")
+                logger.debug("Generation counts by status: %s", result)
                 return result
                 
         except Exception as e:
@@ -1,14 +1,16 @@
 """Repository for order management."""
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, cast
 
-from sqlalchemy import desc
+from sqlalchemy import CursorResult, desc, update
 from sqlalchemy.orm import joinedload
 
 from imagen_desktop.data.repositories.base_repository import BaseRepository
 from imagen_desktop.data.schema import Order as OrderModel
 from imagen_desktop.data.schema import Generation, Product
 from imagen_desktop.core.models.order import Order, OrderStatus
+from imagen_desktop.core.models.generation import Generation as GenDomain
+from imagen_desktop.core.models.product import Product as ProdDomain
 from imagen_desktop.utils.debug_logger import LogManager
 
 logger = LogManager.get_logger(__name__)
@@ -108,13 +110,11 @@ class OrderRepository(BaseRepository):
                 
                 for gen_model in order_model.generations:
                     # Add generation
-                    from imagen_desktop.core.models.generation import Generation as GenDomain
                     gen = GenDomain.from_db_model(gen_model)
                     generations.append(gen)
                     
                     # Add products
                     for prod_model in gen_model.products:
-                        from imagen_desktop.core.models.product import Product as ProdDomain
                         prod = ProdDomain.from_db_model(prod_model)
                         products.append(prod)
                 
@@ -143,13 +143,15 @@ class OrderRepository(BaseRepository):
         """
         try:
             with self._get_session() as session:
-                order_model = session.query(OrderModel)\
-                    .filter(OrderModel.id == order_id)\
-                    .first()
-                if order_model:
-                    order_model.status = status.value
-                    session.commit()
-                    logger.debug(f"Updated order {order_id} status to {status.value}")
+                result = cast(CursorResult, session.execute(
+                    update(OrderModel)
+                    .where(OrderModel.id == order_id)
+                    .values(status=status.value)
+                ))
+                session.commit()
+                
+                if result.rowcount:
+                    logger.debug("Updated order %s status to %s", order_id, status.value)
                     return True
                 
                 logger.warning(f"Order {order_id} not found for status update")
@@ -196,7 +198,7 @@ class OrderRepository(BaseRepository):
                 # Convert to domain models
                 orders = [Order.from_db_model(model) for model in order_models]
                 
-                logger.debug(f"Retrieved {len(orders)} orders")
+                logger.debug("Retrieved %s orders", len(orders))
                 return orders
                 
         except Exception as e:
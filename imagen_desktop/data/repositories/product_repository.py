@@ -1,9 +1,10 @@
 """Repository for managing products."""
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
+import os
 
-from sqlalchemy import desc
+from sqlalchemy import Row, Select, desc, select
 
 from imagen_desktop.core.models.product import Product, ProductType
 from imagen_desktop.data.schema import Product as ProductModel
@@ -16,8 +17,27 @@ from imagen_desktop.utils.debug_logger import logger
 class ProductRepository(BaseRepository):
     """Repository for managing product data and persistence."""
 
-    def _model_to_domain(self, model: ProductModel) -> Product:
-        """Convert DB model to domain model."""
+    # Columns read for listings, as plain rows instead of ORM objects
+    _LIST_COLUMNS = (
+        ProductModel.id,
+        ProductModel.file_path,
+        ProductModel.product_type,
+        ProductModel.generation_id,
+        ProductModel.created_at,
+        ProductModel.width,
+        ProductModel.height,
+        ProductModel.format,
+        ProductModel.file_size,
+        ProductModel.product_metadata,
+    )
+
+    _SORT_COLUMNS = {
+        'created_at': ProductModel.created_at,
+        'file_size': ProductModel.file_size,
+    }
+
+    def _model_to_domain(self, model: Union[ProductModel, Row]) -> Product:
+        """Convert a DB model, or a row of _LIST_COLUMNS, to a domain model."""
         return Product(
             id=model.id,
             file_path=Path(model.file_path),
@@ -92,6 +112,64 @@ class ProductRepository(BaseRepository):
             logger.error(f"Error creating product: {e}")
             return None
 
+    def create_products(self, rows: List[Dict[str, Any]]) -> List[Product]:
+        """Create several products in a single transaction.
+        
+        Args:
+            rows: Keyword arguments for each product, as accepted by create_product
+            
+        Returns:
+            List of created Products (empty if creation failed)
+        """
+        try:
+            created_at = datetime.now()
+            models = []
+            for row in rows:
+                file_path = Path(row['file_path'])
+                # One stat per new file; a batch is a handful of outputs
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    logger.error(f"File not found: {file_path}")
+                    continue
+                
+                product_type = row.get('product_type', ProductType.IMAGE)
+                models.append(ProductModel(
+                    file_path=str(file_path),
+                    product_type=product_type.value,
+                    generation_id=row.get('generation_id'),
+                    created_at=created_at,
+                    width=row.get('width'),
+                    height=row.get('height'),
+                    format=row.get('format'),
+                    file_size=stat.st_size,
+                    product_metadata={}
+                ))
+            
+            if not models:
+                return []
+            
+            with self._get_session() as session:
+                session.add_all(models)
+                # Flush to assign IDs, then convert the rows
+                session.flush()
+                products = [self._model_to_domain(m) for m in models]
+                session.commit()
+            
+            for product in products:
+                event = ProductEvent(
+                    event_type=ProductEventType.CREATED,
+                    product=product
+                )
+                ProductEventPublisher.publish_product_event(event)
+            
+            logger.info(f"Created {len(products)} products")
+            return products
+            
+        except Exception as e:
+            logger.error(f"Error creating products: {e}")
+            return []
+
     def get_product(self, product_id: int) -> Optional[Product]:
         """Get a product by ID."""
         try:
@@ -109,13 +187,51 @@ class ProductRepository(BaseRepository):
         try:
             with self._get_session() as session:
                 models = session.query(ProductModel).order_by(
-                    desc(ProductModel.created_at)
+                    desc(ProductModel.created_at), desc(ProductModel.id)
                 ).all()
                 return [self._model_to_domain(m) for m in models]
         except Exception as e:
             logger.error(f"Error retrieving products: {e}")
             return []
 
+    def list_products(self,
+                      product_type: Optional[Union[ProductType, str]] = None,
+                      order_by: str = 'created_at',
+                      descending: bool = True,
+                      limit: Optional[int] = None) -> List[Product]:
+        """List products with filtering, ordering and limit applied in SQL.
+        
+        Rows are selected as column tuples and mapped straight to domain
+        objects, skipping ORM identity map and instrumentation overhead.
+        
+        Args:
+            product_type: Only list products of this type
+            order_by: Column to sort on ('created_at' or 'file_size')
+            descending: Sort in descending order
+            limit: Maximum number of products to return
+            
+        Returns:
+            List of Products
+        """
+        try:
+            column: Any = self._SORT_COLUMNS[order_by]
+            # Bulk inserts share created_at, so id keeps their order stable
+            stmt: Select = select(*self._LIST_COLUMNS).order_by(
+                *((desc(column), desc(ProductModel.id)) if descending
+                  else (column, ProductModel.id))
+            )
+            if product_type:
+                stmt = stmt.where(ProductModel.product_type == ProductType(product_type).value)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            
+            with self._get_session() as session:
+                rows = session.execute(stmt).all()
+            return [self._model_to_domain(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error listing products: {e}")
+            return []
+
     def update_product(self, product: Product) -> bool:
         """Update an existing product."""
         try:
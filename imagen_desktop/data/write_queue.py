@@ -0,0 +1,61 @@
+"""Background thread applying database writes in submission order."""
+from typing import Any, Callable
+import queue
+import threading
+
+from imagen_desktop.utils.debug_logger import logger
+
+class WriteQueue:
+    """Runs database writes one at a time on a dedicated thread.
+
+    Callers return as soon as a write is queued, so a commit never holds
+    up the GUI thread. Writes are applied in the order they were
+    submitted; writes whose result the caller needs must still be made
+    directly.
+    """
+
+    _STOP = object()
+
+    def __init__(self, name: str = "database-writer"):
+        """Initialize the queue and start its writer thread.
+
+        Args:
+            name: Name of the writer thread, shown in logs and debuggers
+        """
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs):
+        """Queue a call to be made on the writer thread."""
+        self._queue.put((func, args, kwargs))
+
+    def join(self):
+        """Block until every queued write has been applied."""
+        self._queue.join()
+
+    def close(self, timeout: float = 5.0):
+        """Apply the queued writes, then stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for outstanding writes
+        """
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Database writer did not finish before shutdown")
+
+    def _run(self):
+        """Apply queued writes until stopped."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                func, args, kwargs = item
+                try:
+                    func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Queued database write failed: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
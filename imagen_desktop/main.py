@@ -2,6 +2,7 @@
 import sys
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtGui import QPixmapCache
 
 from imagen_desktop.ui.main_window import MainWindow
 from imagen_desktop.data import initialize_database
@@ -27,6 +28,9 @@ def main():
     """Application entry point."""
     app = QApplication(sys.argv)
     
+    # Room for shared thumbnail pixmaps (limit is in KB)
+    QPixmapCache.setCacheLimit(64 * 1024)
+    
     try:
         # Initialize components
         database = initialize_app()
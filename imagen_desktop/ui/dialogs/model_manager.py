@@ -8,10 +8,11 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor
 from typing import Dict, Any
 
-from .model_manager_presenter import ModelManagerPresenter
+from .model_manager_presenter import ModelManagerPresenter, MODEL_COLLECTION
 from ...api.api_handler import APIHandler
 from ...data.repositories.model_repository import ModelRepository
 from ...utils.debug_logger import logger
+from ...utils.model_cache import has_cached_models, is_cache_stale, load_cached_models
 
 class ModelManager(QDialog):
     """Dialog for browsing and managing models."""
@@ -21,9 +22,15 @@ class ModelManager(QDialog):
     def __init__(self, api_handler: APIHandler, model_repository: ModelRepository, parent=None):
         super().__init__(parent)
         self.presenter = ModelManagerPresenter(api_handler, model_repository)
+        self.showing_cached = False
         self._init_ui()
         self._load_models()
         self._connect_signals()
+        
+        # Revalidate a cached listing older than the TTL, so the next
+        # refresh shows current models straight away
+        if has_cached_models(MODEL_COLLECTION) and is_cache_stale(MODEL_COLLECTION):
+            self._revalidate_cache()
     
     def _init_ui(self):
         """Initialize the user interface."""
@@ -99,7 +106,10 @@ class ModelManager(QDialog):
     def _connect_signals(self):
         """Connect presenter signals."""
         self.presenter.loader_thread.models_loaded.connect(self._on_models_loaded)
+        self.presenter.loader_thread.models_unchanged.connect(self._on_models_unchanged)
         self.presenter.loader_thread.error_occurred.connect(self._on_load_error)
+        self.presenter.revalidation_thread.models_loaded.connect(self._on_cache_revalidated)
+        self.presenter.revalidation_thread.error_occurred.connect(self._on_revalidation_error)
     
     def _load_models(self):
         """Load and display models."""
@@ -111,14 +121,50 @@ class ModelManager(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to load models: {str(e)}")
     
     def _refresh_models(self):
-        """Start loading available models."""
+        """Start loading available models.
+        
+        A previously fetched listing is shown straight from the disk cache
+        while the fetch runs, and is kept if the fetch returns the same.
+        """
+        if not self.showing_cached:
+            cached = load_cached_models(MODEL_COLLECTION)
+            if cached:
+                self.showing_cached = True
+                self._populate_model_list(cached)
+                if self.search_input.text():
+                    self._filter_models()
+        
         self.refresh_button.setEnabled(False)
         self.progress_bar.show()
         self.status_label.setText("Loading available models...")
-        self.presenter.loader_thread.load_models()
+        self.presenter.loader_thread.start()
+    
+    def _revalidate_cache(self):
+        """Fetch available models into the cache without changing the view."""
+        self.presenter.revalidation_thread.start()
+    
+    def _on_cache_revalidated(self, models: list):
+        """Handle a background revalidation that changed the listing.
+        
+        The loader has already cached the new listing. If the tree is
+        showing the old cached listing, it is replaced with the new one;
+        installed models or a freshly fetched listing are left as they are.
+        """
+        logger.debug(f"Revalidated {len(models)} cached available models")
+        if not self.showing_cached:
+            return
+        self._populate_model_list(models)
+        if self.search_input.text():
+            self._filter_models()
+    
+    def _on_revalidation_error(self, error: str):
+        """Handle a failed background revalidation."""
+        # Nobody asked for this fetch; don't interrupt with a dialog
+        logger.warning(f"Could not revalidate cached models: {error}")
     
     def _on_models_loaded(self, models: list):
         """Handle loaded model data."""
+        self.showing_cached = False
         self._populate_model_list(models)
         self.refresh_button.setEnabled(True)
         self.progress_bar.hide()
@@ -127,10 +173,25 @@ class ModelManager(QDialog):
         if self.search_input.text():
             self._filter_models()
     
+    def _on_models_unchanged(self, models: list):
+        """Handle a refreshed listing identical to the cached one."""
+        if not self.showing_cached:
+            self._on_models_loaded(models)
+            return
+        
+        # The tree already shows this listing; keep it and its selection
+        self.refresh_button.setEnabled(True)
+        self.progress_bar.hide()
+        self.status_label.setText(f"Available models are up to date ({len(models)})")
+    
     def _on_load_error(self, error: str):
         """Handle model loading error."""
         self.refresh_button.setEnabled(True)
         self.progress_bar.hide()
+        if self.showing_cached:
+            # Keep the stale listing rather than interrupting the user
+            self.status_label.setText("Could not refresh; showing cached models")
+            return
         self.status_label.setText("Error loading models")
         QMessageBox.critical(self, "Error", f"Failed to load models: {error}")
     
@@ -3,24 +3,39 @@ import replicate
 from typing import List, Dict, Any, Set, Optional
 from pathlib import Path
 import json
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
 
 from ...api.api_handler import APIHandler
 from ...data.repositories.model_repository import ModelRepository
 from ...utils.debug_logger import logger
+from ...utils.model_cache import (
+    is_listing_unchanged, save_cached_models, touch_cached_models
+)
+
+# Replicate collection browsed by the model manager
+MODEL_COLLECTION = "text-to-image"
 
 class ModelLoaderThread(QObject):
     """Background thread for loading models."""
     models_loaded = pyqtSignal(list)  # Emits list of model data
+    models_unchanged = pyqtSignal(list)  # Emits model data matching the cache
     error_occurred = pyqtSignal(str)  # Emits error message
     
     def __init__(self):
         super().__init__()
     
+    def start(self):
+        """Load models on a thread pool worker.
+        
+        Results arrive through models_loaded or error_occurred, queued to
+        the receivers' thread, so no widget is touched off the GUI thread.
+        """
+        QThreadPool.globalInstance().start(self.load_models)
+    
     def load_models(self):
         """Load available models from Replicate."""
         try:
-            collection = replicate.collections.get("text-to-image")
+            collection = replicate.collections.get(MODEL_COLLECTION)
             models = []
             
             for model in collection.models:
@@ -33,7 +48,13 @@ class ModelLoaderThread(QObject):
                     'featured': False
                 })
             
-            self.models_loaded.emit(models)
+            if is_listing_unchanged(MODEL_COLLECTION, models):
+                logger.debug(f"Cached {MODEL_COLLECTION} models unchanged")
+                touch_cached_models(MODEL_COLLECTION)
+                self.models_unchanged.emit(models)
+            else:
+                save_cached_models(MODEL_COLLECTION, models)
+                self.models_loaded.emit(models)
             
         except Exception as e:
             logger.error(f"Error loading models: {e}")
@@ -48,6 +69,9 @@ class ModelManagerPresenter:
         self.installed_models: Set[str] = set()
         self.current_models: List[Dict] = []
         self.loader_thread = ModelLoaderThread()
+        # Separate loader for background revalidation, so its results are
+        # never mistaken for those of a refresh the user asked for
+        self.revalidation_thread = ModelLoaderThread()
         
         self._load_installed_models()
     
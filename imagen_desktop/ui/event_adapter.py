@@ -69,29 +69,29 @@ class EventAdapter(QObject):
             # Process based on event type
             if event.event_type == OrderEventType.CREATED:
                 self.order_created.emit(event.data.order)
-                logger.debug(f"Order created event emitted for order {event.entity_id}")
+                logger.debug("Order created event emitted for order %s", event.entity_id)
             
             elif event.event_type == OrderEventType.UPDATED:
                 self.order_updated.emit(event.data.order)
-                logger.debug(f"Order updated event emitted for order {event.entity_id}")
+                logger.debug("Order updated event emitted for order %s", event.entity_id)
             
             elif event.event_type == OrderEventType.STATUS_CHANGED:
                 self.order_status_changed.emit(event.entity_id, event.data.order.status.value)
-                logger.debug(f"Order status changed event emitted for order {event.entity_id}")
+                logger.debug("Order status changed event emitted for order %s", event.entity_id)
             
             elif event.event_type == OrderEventType.FULFILLED:
                 self.order_fulfilled.emit(event.data.order)
-                logger.debug(f"Order fulfilled event emitted for order {event.entity_id}")
+                logger.debug("Order fulfilled event emitted for order %s", event.entity_id)
             
             elif event.event_type == OrderEventType.FAILED:
                 error_msg = event.data.error or "Unknown error"
                 self.order_failed.emit(event.data.order, error_msg)
                 self.error_occurred.emit("Order Failed", error_msg)
-                logger.debug(f"Order failed event emitted for order {event.entity_id}")
+                logger.debug("Order failed event emitted for order %s", event.entity_id)
             
             elif event.event_type == OrderEventType.CANCELED:
                 self.order_canceled.emit(event.data.order)
-                logger.debug(f"Order canceled event emitted for order {event.entity_id}")
+                logger.debug("Order canceled event emitted for order %s", event.entity_id)
                 
         except Exception as e:
             stack_trace = traceback.format_exc()
@@ -110,28 +110,28 @@ class EventAdapter(QObject):
             if event.event_type == GenerationEventType.STARTED:
                 # Emit the prediction_id to match what the UI components expect
                 self.generation_started.emit(event.data.generation.id)
-                logger.debug(f"Generation started event emitted for generation {event.entity_id}")
+                logger.debug("Generation started event emitted for generation %s", event.entity_id)
             
             elif event.event_type == GenerationEventType.PROCESSING:
                 self.generation_processing.emit(event.data.generation)
-                logger.debug(f"Generation processing event emitted for generation {event.entity_id}")
+                logger.debug("Generation processing event emitted for generation %s", event.entity_id)
             
             elif event.event_type == GenerationEventType.COMPLETED:
                 # Emit the prediction_id and products list to match what the UI components expect
                 self.generation_completed.emit(event.data.generation.id, event.data.products or [])
-                logger.debug(f"Generation completed event emitted for generation {event.entity_id}")
+                logger.debug("Generation completed event emitted for generation %s", event.entity_id)
             
             elif event.event_type == GenerationEventType.FAILED:
                 # Emit the prediction_id and error message to match what the UI components expect
                 error_msg = event.data.error or "Unknown error during generation"
                 self.generation_failed.emit(event.data.generation.id, error_msg)
                 self.error_occurred.emit("Generation Failed", error_msg)
-                logger.debug(f"Generation failed event emitted for generation {event.entity_id}")
+                logger.debug("Generation failed event emitted for generation %s", event.entity_id)
             
             elif event.event_type == GenerationEventType.CANCELED:
                 # Emit the prediction_id to match what the UI components expect
                 self.generation_canceled.emit(event.data.generation.id)
-                logger.debug(f"Generation canceled event emitted for generation {event.entity_id}")
+                logger.debug("Generation canceled event emitted for generation %s", event.entity_id)
                 
         except Exception as e:
             stack_trace = traceback.format_exc()
@@ -149,19 +149,19 @@ class EventAdapter(QObject):
             # Process based on event type
             if event.event_type == ProductEventType.CREATED:
                 self.product_created.emit(event.data.product)
-                logger.debug(f"Product created event emitted for product {event.entity_id}")
+                logger.debug("Product created event emitted for product %s", event.entity_id)
             
             elif event.event_type == ProductEventType.UPDATED:
                 self.product_updated.emit(event.data.product)
-                logger.debug(f"Product updated event emitted for product {event.entity_id}")
+                logger.debug("Product updated event emitted for product %s", event.entity_id)
             
             elif event.event_type == ProductEventType.DELETED:
                 self.product_deleted.emit(event.data.product)
-                logger.debug(f"Product deleted event emitted for product {event.entity_id}")
+                logger.debug("Product deleted event emitted for product %s", event.entity_id)
             
             elif event.event_type == ProductEventType.SELECTED:
                 self.product_selected.emit(event.data.product)
-                logger.debug(f"Product selected event emitted for product {event.entity_id}")
+                logger.debug("Product selected event emitted for product %s", event.entity_id)
                 
         except Exception as e:
             stack_trace = traceback.format_exc()
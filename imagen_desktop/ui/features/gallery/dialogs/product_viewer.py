@@ -1,15 +1,16 @@
 """Dialog for viewing products at full size."""
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QWidget, QScrollArea, QFileDialog
+    QPushButton, QWidget, QScrollArea, QFileDialog, QMessageBox
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QGuiApplication
 from typing import List
 from pathlib import Path
 import shutil
 
 from imagen_desktop.core.models.product import Product
+from imagen_desktop.ui.shared.pixmap_cache import pixmap_cache
 from imagen_desktop.utils.debug_logger import logger
 
 class ProductViewer(QDialog):
@@ -84,7 +85,7 @@ class ProductViewer(QDialog):
             file_path = Path(product.file_path) if isinstance(product.file_path, str) else product.file_path
             
             if file_path.exists():
-                pixmap = QPixmap(str(file_path))
+                pixmap = pixmap_cache.get(file_path)
                 if not pixmap.isNull():
                     scaled_pixmap = pixmap.scaled(
                         self.image_label.size(),
@@ -131,16 +132,14 @@ class ProductViewer(QDialog):
         """Copy current image to clipboard."""
         if 0 <= self.current_index < len(self.products):
             try:
-                from PyQt6.QtGui import QGuiApplication
                 clipboard = QGuiApplication.clipboard()
                 product = self.products[self.current_index]
                 file_path = Path(product.file_path) if isinstance(product.file_path, str) else product.file_path
-                pixmap = QPixmap(str(file_path))
+                pixmap = pixmap_cache.get(file_path)
                 clipboard.setPixmap(pixmap)
                 logger.debug(f"Copied product {product.id} to clipboard")
             except Exception as e:
                 logger.error(f"Failed to copy to clipboard: {e}")
-                from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.critical(self, "Error", f"Failed to copy image: {str(e)}")
     
     def _save_as(self):
@@ -158,11 +157,10 @@ class ProductViewer(QDialog):
             
             if file_name:
                 try:
-                    shutil.copy2(file_path, file_name)
+                    shutil.copyfile(file_path, file_name)
                     logger.debug(f"Saved product {product.id} to {file_name}")
                 except Exception as e:
                     logger.error(f"Failed to save image: {e}")
-                    from PyQt6.QtWidgets import QMessageBox
                     QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
     
     def resizeEvent(self, event):
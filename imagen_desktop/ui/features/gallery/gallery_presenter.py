@@ -1,17 +1,30 @@
 """Gallery presenter handling business logic for the gallery view."""
-from typing import List, Optional
-from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
+import time
 
 from imagen_desktop.core.models.product import Product, ProductType
 from imagen_desktop.data.repositories.product_repository import ProductRepository
 from imagen_desktop.core.events.product_events import (
     ProductEvent, ProductEventType, ProductEventPublisher
 )
+from imagen_desktop.ui.shared.pixmap_cache import pixmap_cache
+from imagen_desktop.ui.shared.thumbnails import remove_cached_thumbnail
 from imagen_desktop.utils.debug_logger import logger
 
 class GalleryPresenter:
     """Presenter for gallery view."""
     
+    # Seconds a product listing is reused before querying again
+    LIST_CACHE_TTL = 5.0
+    
+    # Sort option -> (repository column, descending)
+    SORT_ORDERS = {
+        "Most Recent": ('created_at', True),
+        "Oldest First": ('created_at', False),
+        "Largest Files": ('file_size', True),
+        "Smallest Files": ('file_size', False),
+    }
+    
     def __init__(self, 
                  product_repository: ProductRepository,
                  view=None):
@@ -23,6 +36,12 @@ class GalleryPresenter:
         """
         self.product_repository = product_repository
         self.view = view
+        
+        # Products from the last listing, for lookups without a query
+        self._products_by_id: Dict[int, Product] = {}
+        
+        # Recent listings keyed by query, as (timestamp, products)
+        self._list_cache: Dict[str, Tuple[float, List[Product]]] = {}
     
     def list_products(self, 
                      limit: Optional[int] = None,
@@ -39,26 +58,20 @@ class GalleryPresenter:
             List of Product objects
         """
         try:
-            # Get all products
-            products = self.product_repository.get_all_products()
+            cache_key = f"list-{product_type}-{sort_by}-{limit}"
+            cached = self._list_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.LIST_CACHE_TTL:
+                return list(cached[1])
             
-            # Filter by type if specified
-            if product_type:
-                products = [p for p in products if p.product_type == product_type]
-            
-            # Apply sorting
-            if sort_by == "Most Recent":
-                products.sort(key=attrgetter('created_at'), reverse=True)
-            elif sort_by == "Oldest First":
-                products.sort(key=attrgetter('created_at'))
-            elif sort_by == "Largest Files":
-                products.sort(key=attrgetter('file_size'), reverse=True)
-            elif sort_by == "Smallest Files":
-                products.sort(key=attrgetter('file_size'))
-            
-            # Apply limit if specified
-            if limit is not None:
-                products = products[:limit]
+            # Filter, sort and limit in the database
+            order_by, descending = self.SORT_ORDERS.get(sort_by, ('created_at', True))
+            products = self.product_repository.list_products(
+                product_type=product_type,
+                order_by=order_by,
+                descending=descending,
+                limit=limit
+            )
+            self._products_by_id = {p.id: p for p in products}
             
             logger.debug(
                 f"Listed {len(products)} products",
@@ -70,7 +83,8 @@ class GalleryPresenter:
                 }
             )
             
-            return products
+            self._list_cache[cache_key] = (time.monotonic(), products)
+            return list(products)
             
         except Exception as e:
             logger.error(f"Error listing products: {e}")
@@ -86,10 +100,18 @@ class GalleryPresenter:
             True if deletion was successful
         """
         try:
+            product = self._get_product(product_id)
             success = self.product_repository.delete_product(product_id)
             if not success:
                 logger.error(f"Failed to delete product {product_id}")
-            return success
+                return False
+            
+            self.invalidate_cache()
+            if product:
+                self._forget_product(product)
+                pixmap_cache.invalidate(product.file_path)
+                remove_cached_thumbnail(product.file_path)
+            return True
             
         except Exception as e:
             logger.error(f"Error deleting product: {e}")
@@ -105,7 +127,7 @@ class GalleryPresenter:
             Dict containing product metadata
         """
         try:
-            product = self.product_repository.get_product(product_id)
+            product = self._get_product(product_id)
             if product:
                 return {
                     'width': product.width,
@@ -120,4 +142,19 @@ class GalleryPresenter:
             
         except Exception as e:
             logger.error(f"Error getting product details: {e}")
-            return {}
\ No newline at end of file
+            return {}
+    
+    def invalidate_cache(self):
+        """Discard cached product listings after the products change."""
+        self._list_cache.clear()
+    
+    def _get_product(self, product_id: int) -> Optional[Product]:
+        """Get a product from the last listing, falling back to the repository."""
+        product = self._products_by_id.get(product_id)
+        if product:
+            return product
+        return self.product_repository.get_product(product_id)
+    
+    def _forget_product(self, product: Product):
+        """Drop a deleted product from the listing lookups."""
+        self._products_by_id.pop(product.id, None)
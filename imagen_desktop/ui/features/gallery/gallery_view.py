@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QComboBox, QMessageBox
 )
+from PyQt6.QtCore import QTimer
 
 from imagen_desktop.ui.features.gallery.widgets.product_grid import ProductGrid
 from imagen_desktop.ui.features.gallery.gallery_presenter import GalleryPresenter
@@ -17,6 +18,9 @@ from imagen_desktop.utils.debug_logger import logger
 class GalleryView(QWidget):
     """Main gallery view combining grid and controls."""
     
+    # Minimum interval in ms between refreshes; requests in between coalesce
+    REFRESH_THROTTLE_MS = 150
+    
     def __init__(self, product_repository: ProductRepository):
         super().__init__()
         
@@ -26,8 +30,19 @@ class GalleryView(QWidget):
             view=self
         )
         
+        # The first request in a burst starts this timer and later ones join
+        # it, so a burst runs one query without postponing it indefinitely
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_THROTTLE_MS)
+        self._refresh_timer.timeout.connect(self._refresh_gallery_now)
+        self._force_next_refresh = False
+        
         self._init_ui()
         self._connect_signals()
+        
+        # Load products once the event loop runs, so construction doesn't
+        # hold up the main window's first paint
         self.refresh_gallery()
     
     def _init_ui(self):
@@ -39,12 +54,7 @@ class GalleryView(QWidget):
         
         # Sort options
         self.sort_combo = QComboBox()
-        self.sort_combo.addItems([
-            "Most Recent",
-            "Oldest First",
-            "Largest Files",
-            "Smallest Files"
-        ])
+        self.sort_combo.addItems(list(GalleryPresenter.SORT_ORDERS))
         controls_layout.addWidget(QLabel("Sort by:"))
         controls_layout.addWidget(self.sort_combo)
         
@@ -66,13 +76,18 @@ class GalleryView(QWidget):
     
     def _connect_signals(self):
         """Connect signals and events."""
-        self.refresh_button.clicked.connect(self.refresh_gallery)
+        self.refresh_button.clicked.connect(self._force_refresh)
         self.sort_combo.currentTextChanged.connect(self.refresh_gallery)
         
         # Subscribe to product events
         ProductEventPublisher.subscribe_to_products(self._handle_product_event)
     
     def refresh_gallery(self):
+        """Schedule a gallery refresh, coalescing rapid repeated requests."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+    
+    def _refresh_gallery_now(self):
         """Refresh the gallery display."""
         # Get current sort option
         sort_by = self.sort_combo.currentText()
@@ -84,18 +99,26 @@ class GalleryView(QWidget):
         )
         
         # Update grid
-        self.product_grid.set_products(products)
+        self.product_grid.set_products(products, force=self._force_next_refresh)
+        self._force_next_refresh = False
         
         # Update status
         self.status_label.setText(f"{len(products)} products")
-        logger.debug(f"Refreshed gallery with {len(products)} products")
+        logger.debug("Refreshed gallery with %s products", len(products))
+    
+    def _force_refresh(self):
+        """Refresh the gallery, bypassing cached listings and unchanged checks."""
+        self.presenter.invalidate_cache()
+        self._force_next_refresh = True
+        self.refresh_gallery()
     
     def _handle_product_event(self, event: ProductEvent):
         """Handle product-related events."""
-        logger.debug(f"Gallery received product event: {event.event_type}")
+        logger.debug("Gallery received product event: %s", event.event_type)
         
         if event.event_type == ProductEventType.CREATED:
             # Refresh gallery to show new product
+            self.presenter.invalidate_cache()
             self.refresh_gallery()
             self.status_label.setText("New product added")
             
@@ -103,7 +126,9 @@ class GalleryView(QWidget):
             self._show_product_viewer(event.data.product)
             
         elif event.event_type == ProductEventType.DELETED:
-            self.refresh_gallery()
+            # The grid drops the deleted thumbnail itself through its own
+            # subscription; the next listing re-queries
+            self.presenter.invalidate_cache()
             self.status_label.setText("Product deleted successfully")
             
         elif event.event_type == ProductEventType.ERROR:
@@ -1,6 +1,7 @@
 """Grid layout for displaying product thumbnails."""
 from PyQt6.QtWidgets import QGridLayout
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QRect
+from typing import List, Tuple
 
 from imagen_desktop.ui.shared.widgets.base_product_display import BaseProductDisplay
 from imagen_desktop.ui.shared.widgets.product_thumbnail import ProductThumbnail
@@ -10,11 +11,20 @@ class ProductGrid(BaseProductDisplay):
     """Grid layout for product thumbnails."""
     
     def __init__(self):
-        self.current_row = 0
-        self.current_col = 0
+        self.next_index = 0
         self.max_cols = 3
         super().__init__()
     
+    @property
+    def current_row(self) -> int:
+        """Row the next appended thumbnail goes into."""
+        return self.next_index // self.max_cols
+    
+    @property
+    def current_col(self) -> int:
+        """Column the next appended thumbnail goes into."""
+        return self.next_index % self.max_cols
+    
     def _create_layout(self) -> QGridLayout:
         """Create grid layout for thumbnails."""
         layout = QGridLayout()
@@ -23,19 +33,10 @@ class ProductGrid(BaseProductDisplay):
     
     def _add_to_layout(self, thumbnail: ProductThumbnail, position=None):
         """Add thumbnail to grid layout."""
-        if position is not None:
-            # Calculate row and column from position
-            row = position // self.max_cols
-            col = position % self.max_cols
-        else:
-            row = self.current_row
-            col = self.current_col
-            
-            # Update next position
-            self.current_col += 1
-            if self.current_col >= self.max_cols:
-                self.current_col = 0
-                self.current_row += 1
+        if position is None:
+            position = self.next_index
+            self.next_index += 1
+        row, col = divmod(position, self.max_cols)
         
         self.content_layout.addWidget(thumbnail, row, col)
         
@@ -43,6 +44,54 @@ class ProductGrid(BaseProductDisplay):
         if row > 0:
             self.content_layout.setRowStretch(row + 1, 1)
     
+    def _layout_thumbnails(self, thumbnails: List[ProductThumbnail]):
+        """Place thumbnails in grid order.
+        
+        Thumbnails already in their target cell are left in place, so a
+        refresh only re-inserts the ones that actually moved.
+        """
+        layout = self.content_layout
+        for i in range(layout.rowCount()):
+            layout.setRowStretch(i, 0)
+        
+        for index, thumbnail in enumerate(thumbnails):
+            row, col = divmod(index, self.max_cols)
+            layout_index = layout.indexOf(thumbnail)
+            if layout_index >= 0:
+                if layout.getItemPosition(layout_index)[:2] == (row, col):
+                    continue
+                layout.removeWidget(thumbnail)
+            layout.addWidget(thumbnail, row, col)
+        
+        # Continue appending after the last thumbnail
+        self.next_index = len(thumbnails)
+        
+        # Add stretch to bottom
+        self.content_layout.setRowStretch(self.current_row + 1, 1)
+    
+    def _thumbnail_range(self, rect: QRect) -> Tuple[int, int]:
+        """Get the slice of thumbnails in the rows crossing an area.
+        
+        Rows are derived from the first row's position and the row pitch,
+        so the cost does not grow with the number of thumbnails.
+        """
+        count = len(self.thumbnails)
+        if count <= self.max_cols:
+            return 0, count
+        
+        top = self.thumbnails[0].geometry().top()
+        pitch = self.thumbnails[self.max_cols].geometry().top() - top
+        if pitch <= 0:
+            # Not laid out yet
+            return 0, count
+        
+        first_row = max(0, (rect.top() - top) // pitch)
+        last_row = max(0, (rect.bottom() - top) // pitch)
+        return (
+            min(count, first_row * self.max_cols),
+            min(count, (last_row + 1) * self.max_cols)
+        )
+    
     def _clear_layout(self):
         """Clear the grid layout."""
         while self.content_layout.count():
@@ -50,8 +99,7 @@ class ProductGrid(BaseProductDisplay):
             if item.widget():
                 item.widget().deleteLater()
         
-        self.current_row = 0
-        self.current_col = 0
+        self.next_index = 0
         
         # Reset row stretches
         for i in range(self.content_layout.rowCount()):
@@ -1,7 +1,7 @@
 """Horizontal strip layout for displaying product thumbnails."""
 from PyQt6.QtWidgets import QHBoxLayout
 from PyQt6.QtCore import Qt
-from typing import Optional
+from typing import List, Optional
 
 from imagen_desktop.ui.shared.widgets.base_product_display import BaseProductDisplay
 from imagen_desktop.ui.shared.widgets.product_thumbnail import ProductThumbnail
@@ -31,7 +31,7 @@ class ProductStrip(BaseProductDisplay):
         # Remove oldest thumbnail if at limit
         if len(self.thumbnails) >= self.max_thumbnails:
             oldest = self.thumbnails.pop()
-            oldest.deleteLater()
+            self._discard_thumbnail(oldest)
         
         # Add at position or start
         insert_pos = position if position is not None else 0
@@ -41,6 +41,13 @@ class ProductStrip(BaseProductDisplay):
         if insert_pos == 0:
             self.scroll.horizontalScrollBar().setValue(0)
     
+    def _layout_thumbnails(self, thumbnails: List[ProductThumbnail]):
+        """Place thumbnails left to right, ahead of the trailing stretch."""
+        for thumbnail in thumbnails:
+            self.content_layout.removeWidget(thumbnail)
+        for index, thumbnail in enumerate(thumbnails):
+            self.content_layout.insertWidget(index, thumbnail)
+    
     def _clear_layout(self):
         """Clear the strip layout."""
         while self.content_layout.count():
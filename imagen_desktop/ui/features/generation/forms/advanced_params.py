@@ -52,9 +52,9 @@ class AdvancedParams(QWidget):
         self.num_inference_steps.valueChanged.connect(self._emit_params)
     
     def _emit_params(self):
-        """Emit updated parameters."""
-        params = self.get_parameters()
-        self.params_changed.emit(params)
+        """Emit updated parameters, if anyone is listening."""
+        if self.receivers(self.params_changed) > 0:
+            self.params_changed.emit(self.get_parameters())
     
     def get_parameters(self) -> AdvancedParameters:
         """Get current parameter values."""
@@ -29,7 +29,9 @@ class CollapsibleSection(QFrame):
         
         # Title label
         title_label = QLabel(self.title)
-        title_label.setStyleSheet("font-weight: bold;")
+        font = title_label.font()
+        font.setBold(True)
+        title_label.setFont(font)
         header_layout.addWidget(title_label)
         
         # Toggle button
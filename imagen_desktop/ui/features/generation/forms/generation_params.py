@@ -16,6 +16,14 @@ class GenerationParameters:
 class GenerationParams(QWidget):
     params_changed = pyqtSignal(object)  # Emits GenerationParameters
     
+    # Preset label -> (width, height); "Custom" is offered after these
+    SIZE_PRESETS = {
+        "Square (512x512)": (512, 512),
+        "Landscape (768x512)": (768, 512),
+        "Portrait (512x768)": (512, 768),
+        "HD (1024x768)": (1024, 768),
+    }
+    
     def __init__(self):
         super().__init__()
         self._init_ui()
@@ -36,13 +44,7 @@ class GenerationParams(QWidget):
         
         # Image size presets
         self.size_preset_combo = QComboBox()
-        self.size_preset_combo.addItems([
-            "Square (512x512)", 
-            "Landscape (768x512)", 
-            "Portrait (512x768)",
-            "HD (1024x768)",
-            "Custom"
-        ])
+        self.size_preset_combo.addItems(list(self.SIZE_PRESETS) + ["Custom"])
         params_layout.addRow("Size Preset:", self.size_preset_combo)
         
         # Custom size inputs
@@ -78,27 +80,24 @@ class GenerationParams(QWidget):
     
     def _handle_size_preset(self, preset: str):
         """Handle size preset selection."""
-        if preset == "Square (512x512)":
-            self.width_spin.setValue(512)
-            self.height_spin.setValue(512)
-        elif preset == "Landscape (768x512)":
-            self.width_spin.setValue(768)
-            self.height_spin.setValue(512)
-        elif preset == "Portrait (512x768)":
-            self.width_spin.setValue(512)
-            self.height_spin.setValue(768)
-        elif preset == "HD (1024x768)":
-            self.width_spin.setValue(1024)
-            self.height_spin.setValue(768)
+        size = self.SIZE_PRESETS.get(preset)
+        if size:
+            width, height = size
+            # Apply both dimensions silently, then announce the new size once
+            self.width_spin.blockSignals(True)
+            self.height_spin.blockSignals(True)
+            try:
+                self.width_spin.setValue(width)
+                self.height_spin.setValue(height)
+            finally:
+                self.width_spin.blockSignals(False)
+                self.height_spin.blockSignals(False)
+            self._emit_params()
     
     def _emit_params(self):
-        """Emit updated parameters."""
-        params = GenerationParameters(
-            num_images=self.num_images_spin.value(),
-            width=self.width_spin.value(),
-            height=self.height_spin.value()
-        )
-        self.params_changed.emit(params)
+        """Emit updated parameters, if anyone is listening."""
+        if self.receivers(self.params_changed) > 0:
+            self.params_changed.emit(self.get_parameters())
     
     def get_parameters(self) -> GenerationParameters:
         """Get current parameter values."""
@@ -20,7 +20,9 @@ class SectionTitle(QFrame):
         
         # Title label
         label = QLabel(text)
-        label.setStyleSheet("font-weight: bold;")
+        font = label.font()
+        font.setBold(True)
+        label.setFont(font)
         layout.addWidget(label)
         
         # Horizontal line
@@ -93,6 +95,15 @@ class GenerationSidebar(QWidget):
         self.generate_button.setMinimumHeight(40)
         self.generate_button.clicked.connect(self._on_generate)
         layout.addWidget(self.generate_button)
+        
+        # Inputs locked while generating; disabling a container also
+        # disables its children, so each input needs no call of its own
+        self._toggled_widgets = [
+            self.model_selector,
+            self.prompt_input,
+            self.parameters,
+            self.generate_button
+        ]
     
     def _connect_signals(self):
         """Connect internal signals."""
@@ -128,7 +139,5 @@ class GenerationSidebar(QWidget):
     
     def set_enabled(self, enabled: bool):
         """Enable or disable all form elements."""
-        self.model_selector.setEnabled(enabled)
-        self.prompt_input.setEnabled(enabled)
-        self.parameters.set_enabled(enabled)
-        self.generate_button.setEnabled(enabled)
\ No newline at end of file
+        for widget in self._toggled_widgets:
+            widget.setEnabled(enabled)
\ No newline at end of file
@@ -1,9 +1,10 @@
 """Model selection component with search and filtering."""
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
-    QComboBox, QLabel, QGroupBox
+    QComboBox, QLabel, QGroupBox, QMessageBox
 )
 from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtGui import QPalette
 from typing import Optional, List, Dict
 import json
 from pathlib import Path
@@ -38,7 +39,9 @@ class ModelSelector(QWidget):
         # Model description
         self.description_label = QLabel()
         self.description_label.setWordWrap(True)
-        self.description_label.setStyleSheet("color: gray;")
+        palette = self.description_label.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.gray)
+        self.description_label.setPalette(palette)
         layout.addWidget(self.description_label)
     
     def _load_default_models(self) -> List[Dict]:
@@ -101,43 +104,49 @@ class ModelSelector(QWidget):
         # Update current models list
         self.current_models = models if isinstance(models, list) else []
         
-        self.model_combo.clear()
-        
         # Sort models: featured first, then alphabetically
         sorted_models = sorted(self.current_models, 
                              key=lambda x: (not x.get('featured', False), x['name'].lower()))
         
-        for model in sorted_models:
-            # Create display name
-            if model.get('featured'):
-                display_name = f"⭐ {model['name']}"
-            else:
-                display_name = model['name']
-                
-            # Add owner in display name
-            display_name += f" ({model['owner']})"
+        # Populate without a selection signal per inserted item
+        self.model_combo.blockSignals(True)
+        try:
+            self.model_combo.clear()
+            selected_index = 0 if sorted_models else -1
             
-            # Store full model data in combo box
-            self.model_combo.addItem(display_name, model)
+            for index, model in enumerate(sorted_models):
+                # Create display name
+                if model.get('featured'):
+                    display_name = f"⭐ {model['name']}"
+                else:
+                    display_name = model['name']
+                    
+                # Add owner in display name
+                display_name += f" ({model['owner']})"
+                
+                # Store full model data in combo box
+                self.model_combo.addItem(display_name, model)
+                
+                # Store description separately for UI
+                self.model_combo.setItemData(
+                    index,
+                    model['description'],
+                    Qt.ItemDataRole.UserRole + 1
+                )
+                
+                # Restore previous selection if possible
+                if current_id and model['identifier'] == current_id:
+                    selected_index = index
             
-            # Store description separately for UI
-            index = self.model_combo.count() - 1
-            self.model_combo.setItemData(
-                index,
-                model['description'],
-                Qt.ItemDataRole.UserRole + 1
-            )
+            self.model_combo.setCurrentIndex(selected_index)
+        finally:
+            self.model_combo.blockSignals(False)
         
         # Enable combo box if we have models
         self.model_combo.setEnabled(bool(self.current_models))
         
-        # Restore previous selection if possible
-        if current_id:
-            for i in range(self.model_combo.count()):
-                model_data = self.model_combo.itemData(i, Qt.ItemDataRole.UserRole)
-                if model_data and model_data['identifier'] == current_id:
-                    self.model_combo.setCurrentIndex(i)
-                    break
+        # Announce the resulting selection once
+        self._on_model_changed(self.model_combo.currentIndex())
     
     def _on_model_changed(self, index):
         """Handle model selection change."""
@@ -156,7 +165,6 @@ class ModelSelector(QWidget):
     def _show_model_manager(self):
         """Show the model manager dialog."""
         if not self.model_repository:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "Not Available",
@@ -8,6 +8,8 @@ from PyQt6.QtGui import QPixmap
 from pathlib import Path
 from typing import Optional
 
+from imagen_desktop.ui.shared.pixmap_cache import pixmap_cache
+
 class OverlayProgressBar(QWidget):
     """Progress bar with semi-transparent background."""
     def __init__(self):
@@ -86,7 +88,10 @@ class OutputDisplay(QWidget):
         layout.addWidget(self.status_label)
     
     def show_progress(self, show: bool = True):
-        """Show or hide the progress overlay."""
+        """Show or hide the progress overlay.
+        
+        The bar stays indeterminate until set_progress reports a percentage.
+        """
         if show:
             self.progress_overlay.progress_bar.setRange(0, 0)  # Indeterminate
             self.progress_overlay.show()
@@ -95,6 +100,13 @@ class OutputDisplay(QWidget):
             self.progress_overlay.hide()
             self.stack.setCurrentWidget(self.stack.widget(0))
     
+    def set_progress(self, percent: int):
+        """Show how far the current generation is, from 0 to 100."""
+        progress_bar = self.progress_overlay.progress_bar
+        if progress_bar.maximum() == 0:
+            progress_bar.setRange(0, 100)
+        progress_bar.setValue(percent)
+    
     def set_status(self, text: str):
         """Update the status text."""
         self.status_label.setText(text)
@@ -103,8 +115,8 @@ class OutputDisplay(QWidget):
         """Display a product image or clear if None."""
         self.current_product = product_path
         
-        if product_path and product_path.exists():
-            pixmap = QPixmap(str(product_path))
+        pixmap = pixmap_cache.get(product_path) if product_path else QPixmap()
+        if not pixmap.isNull():
             scaled_pixmap = pixmap.scaled(
                 self.product_frame.size(),
                 Qt.AspectRatioMode.KeepAspectRatio,
@@ -86,9 +86,11 @@ class ParameterInputs(QWidget):
         self.num_inference_steps.valueChanged.connect(self._emit_params)
     
     def _emit_params(self):
-        """Emit updated parameters."""
-        params = self.get_parameters()
-        self.params_changed.emit(params)
+        """Emit updated parameters, if anyone is listening."""
+        # Parameters are read on demand at generate time; skip building
+        # them on every keystroke when nothing is connected
+        if self.receivers(self.params_changed) > 0:
+            self.params_changed.emit(self.get_parameters())
     
     def get_parameters(self) -> GenerationParameters:
         """Get current parameter values."""
@@ -27,11 +27,15 @@ class PromptInput(QWidget):
         self.prompt_input.setPlaceholderText("Enter your prompt here...")
         self.prompt_input.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
         self.prompt_input.setWordWrapMode(QTextOption.WrapMode.WordWrap)
-        self.prompt_input.textChanged.connect(
-            lambda: self.prompt_changed.emit(self.get_prompt())
-        )
+        self.prompt_input.textChanged.connect(self._on_text_changed)
         layout.addWidget(self.prompt_input)
     
+    def _on_text_changed(self):
+        """Emit the new prompt, if anyone is listening."""
+        # Avoid copying the whole document on every keystroke for nothing
+        if self.receivers(self.prompt_changed) > 0:
+            self.prompt_changed.emit(self.get_prompt())
+    
     def get_prompt(self) -> str:
         """Get the current prompt text."""
         return self.prompt_input.toPlainText()
@@ -3,8 +3,9 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QMessageBox
 )
-from PyQt6.QtCore import pyqtSignal, Qt
-from typing import List, Any
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+from typing import List, Any, Optional
+from pathlib import Path
 
 from imagen_desktop.ui.features.generation.forms.generation_sidebar import GenerationSidebar
 from imagen_desktop.ui.features.generation.forms.output_display import OutputDisplay
@@ -25,6 +26,7 @@ class GenerationForm(QWidget):
         self.api_handler = api_handler
         self.model_repository = model_repository
         self.current_prediction_id = None
+        self._pending_display: Optional[Path] = None
         self._init_ui()
         self._connect_signals()
         ProductEventPublisher.subscribe_to_products(self._handle_product_event)
@@ -66,8 +68,12 @@ class GenerationForm(QWidget):
     
     def _connect_signals(self):
         """Connect internal signals."""
-        # Connect sidebar signals
-        self.sidebar.generation_requested.connect(self.generation_requested.emit)
+        # Forward sidebar requests signal-to-signal, so Qt relays them
+        # without calling back into Python
+        self.sidebar.generation_requested.connect(self.generation_requested)
+        
+        if self.api_handler is not None:
+            self.api_handler.generation_progress.connect(self._on_generation_progress)
     
     def _handle_product_event(self, event: ProductEvent):
         """Handle product events."""
@@ -78,51 +84,81 @@ class GenerationForm(QWidget):
         """Handle product selection."""
         self.output_display.display_product(product.file_path)
     
-    def _update_ui_state(self, generating: bool):
-        """Update UI elements based on generation state."""
-        self.sidebar.set_enabled(not generating)
-        self.output_display.show_progress(generating)
+    def _set_generating(self, generating: bool, status: Optional[str] = None):
+        """Update UI elements for a change in generation state.
+        
+        Args:
+            generating: Whether a generation is in progress
+            status: Status text to show, if it changes
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.sidebar.set_enabled(not generating)
+            self.output_display.show_progress(generating)
+            if status is not None:
+                self.output_display.set_status(status)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _on_generation_started(self, prediction_id: str):
         """Handle generation started signal."""
         try:
             self.current_prediction_id = prediction_id
-            self.output_display.set_status("Generating product...")
-            self.output_display.show_progress(True)
-            self._update_ui_state(True)
-            logger.debug(f"Generation started UI updated for: {prediction_id}")
+            self._set_generating(True, "Generating product...")
+            logger.debug("Generation started UI updated for: %s", prediction_id)
         except Exception as e:
             logger.error(f"Error handling generation started: {e}", exc_info=True)
     
+    def _on_generation_progress(self, prediction_id: str, percent: int):
+        """Handle progress reported while polling the current generation."""
+        if prediction_id == self.current_prediction_id:
+            self.output_display.set_progress(percent)
+    
     def _on_generation_completed(self, prediction_id: str, products: List[Product]):
         """Handle generation completed signal."""
         try:
             if prediction_id != self.current_prediction_id:
-                logger.debug(f"Ignoring completion for non-current prediction: {prediction_id}")
+                logger.debug("Ignoring completion for non-current prediction: %s", prediction_id)
                 return
 
-            self.output_display.set_status("Generation complete!")
-            self.output_display.show_progress(False)
-            self._update_ui_state(False)
+            self._set_generating(False, "Generation complete!")
             
             # Update displays with products
-            logger.debug(f"Adding {len(products)} products to display")
+            logger.debug("Adding %s products to display", len(products))
             for product in products:
                 self.product_strip.add_product(product)
                 
-            # Show latest product in output display
+            # Show latest product in output display once the status and
+            # button changes above have painted
             if products:
-                latest_product = products[-1]
-                logger.debug(f"Displaying latest product with file: {latest_product.file_path}")
-                self.output_display.display_product(latest_product.file_path)
+                self._schedule_display(products[-1].file_path)
             
             self.current_prediction_id = None
         except Exception as e:
             logger.error(f"Error handling generation completed: {e}", exc_info=True)
             self._show_error_dialog("Error", f"Error displaying generation results: {str(e)}")
-            self._update_ui_state(False)
+            self._set_generating(False)
             self.current_prediction_id = None
     
+    def _schedule_display(self, file_path: Path):
+        """Display a product on the next event loop pass.
+
+        Decoding a full-size image is the slowest step of handling a
+        completion, so it runs after the handler returns. Repeated requests
+        before then only display the latest product.
+        """
+        already_pending = self._pending_display is not None
+        self._pending_display = file_path
+        if not already_pending:
+            QTimer.singleShot(0, self._display_pending_product)
+    
+    def _display_pending_product(self):
+        """Display the product scheduled by _schedule_display."""
+        file_path, self._pending_display = self._pending_display, None
+        if file_path is not None:
+            logger.debug("Displaying latest product with file: %s", file_path)
+            self.output_display.display_product(file_path)
+    
     def _on_generation_failed(self, prediction_id: str, error: str):
         """Handle generation failure."""
         try:
@@ -130,14 +166,13 @@ class GenerationForm(QWidget):
                 return
                 
             logger.error(f"Generation failed: {error}")
-            self.output_display.set_status(f"Generation failed: {error}")
-            self.output_display.show_progress(False)
-            self._update_ui_state(False)
-            self._show_error_dialog("Generation Failed", f"The generation failed: {error}")
+            # The failure is shown in the output panel; no modal dialog, as
+            # this arrives from the API rather than from a user action
+            self._set_generating(False, f"Generation failed: {error}")
             self.current_prediction_id = None
         except Exception as e:
             logger.error(f"Error handling generation failure: {e}", exc_info=True)
-            self._update_ui_state(False)
+            self._set_generating(False)
             self.current_prediction_id = None
     
     def _on_generation_canceled(self, prediction_id: str):
@@ -146,13 +181,11 @@ class GenerationForm(QWidget):
             if prediction_id != self.current_prediction_id:
                 return
                 
-            self.output_display.set_status("Generation canceled")
-            self.output_display.show_progress(False)
-            self._update_ui_state(False)
+            self._set_generating(False, "Generation canceled")
             self.current_prediction_id = None
         except Exception as e:
             logger.error(f"Error handling generation cancellation: {e}", exc_info=True)
-            self._update_ui_state(False)
+            self._set_generating(False)
             self.current_prediction_id = None
     
     def _show_error_dialog(self, title: str, message: str):
@@ -17,6 +17,9 @@ from imagen_desktop.utils.debug_logger import logger
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # How long in ms an error from a background event stays in the status bar
+    EVENT_ERROR_TIMEOUT_MS = 10000
+    
     def __init__(self, database: Database):
         super().__init__()
         self.setWindowTitle("Imagen Desktop")
@@ -54,7 +57,7 @@ class MainWindow(QMainWindow):
         self.menu_bar.connect_actions(
             show_models=self._show_model_manager,
             show_generate=lambda: self.tab_widget.setCurrentWidget(self.generation_form),
-            show_gallery=lambda: self.tab_widget.setCurrentWidget(self.gallery_view),
+            show_gallery=lambda: self.tab_widget.setCurrentWidget(self._gallery_tab),
             show_about=self._show_about
         )
         
@@ -73,19 +76,25 @@ class MainWindow(QMainWindow):
             self.presenter.api_handler,
             model_repository=self.presenter.model_repository
         )
-        self.gallery_view = GalleryView(self.presenter.product_repository)
+        # The gallery is built the first time its tab is shown
+        self.gallery_view = None
+        self._gallery_tab = QWidget()
+        self._gallery_layout = QVBoxLayout(self._gallery_tab)
+        self._gallery_layout.setContentsMargins(0, 0, 0, 0)
         
         # Add tabs
         self.tab_widget.addTab(self.generation_form, "Generate")
-        self.tab_widget.addTab(self.gallery_view, "Gallery")
+        self.tab_widget.addTab(self._gallery_tab, "Gallery")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         
-        # Connect error signal from event adapter to show errors in UI
+        # Errors from background events are reported without a modal dialog,
+        # so a burst of failures can't stack dialogs over the window
         if hasattr(self.presenter, 'event_adapter'):
-            self.presenter.event_adapter.error_occurred.connect(self.show_error)
+            self.presenter.event_adapter.error_occurred.connect(self.show_event_error)
     
     def _connect_signals(self):
         """Connect signals between components."""
@@ -111,6 +120,16 @@ class MainWindow(QMainWindow):
                 self.generation_form._on_generation_canceled
             )
     
+    def _on_tab_changed(self, index: int):
+        """Build the gallery when its tab is first shown."""
+        if self.gallery_view is None and self.tab_widget.widget(index) is self._gallery_tab:
+            repository = self.presenter.product_repository
+            if repository is None:
+                logger.error("Cannot show gallery: product repository not available")
+                return
+            self.gallery_view = GalleryView(repository)
+            self._gallery_layout.addWidget(self.gallery_view)
+    
     def _handle_generation_request(self, model: str, params: dict):
         """Handle generation request from the form."""
         try:
@@ -123,10 +142,10 @@ class MainWindow(QMainWindow):
                 return
                 
             logger.info(f"Generation requested: model={model}, params={params}")
-            prediction_id = self.presenter.start_generation(model, params)
+            order_id = self.presenter.start_generation(model, params)
             
-            if prediction_id:
-                self.show_status(f"Generation started: {prediction_id}")
+            if order_id is not None:
+                self.show_status(f"Generation requested for order {order_id}")
             else:
                 self.show_error("Generation Error", "Failed to start generation")
                 
@@ -163,6 +182,11 @@ class MainWindow(QMainWindow):
         """Show a message in the status bar."""
         self.status_bar.showMessage(message, timeout)
     
+    def show_event_error(self, title: str, message: str):
+        """Show an error from a background event in the status bar."""
+        logger.error(f"Event error - {title}: {message}")
+        self.show_status(f"{title}: {message}", self.EVENT_ERROR_TIMEOUT_MS)
+    
     def show_error(self, title: str, message: str):
         """Show an error dialog."""
         logger.error(f"Error dialog shown - {title}: {message}")
@@ -171,4 +195,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle application close."""
         logger.debug("Application closing")
+        presenter = getattr(self, 'presenter', None)
+        if presenter is not None:
+            presenter.api_handler.close()
+            if presenter.database:
+                presenter.database.close()
         event.accept()
\ No newline at end of file
@@ -1,10 +1,6 @@
 """Main window presenter coordinating other presenters."""
-from typing import Optional, Any, List, Dict
-from pathlib import Path
-import requests
+from typing import Optional, Any, Dict
 
-# Update imports to use the correct paths
-from imagen_desktop.core.models.product import Product, ProductType
 from imagen_desktop.api.api_handler import APIHandler
 from imagen_desktop.data.database import Database
 from imagen_desktop.data.repositories.order_repository import OrderRepository
@@ -31,7 +27,7 @@ class MainWindowPresenter:
         self.generation_repository = None
         self.model_repository = None
         self.model_query_repository = None
-        self.product_repository = None
+        self.product_repository: Optional[ProductRepository] = None
         
         if database:
             self._init_repositories()
@@ -39,9 +35,9 @@ class MainWindowPresenter:
         # Initialize event adapter
         self.event_adapter = EventAdapter()
         
-        # Initialize components
+        # Initialize components; the view wires event adapter signals to
+        # its widgets once they exist
         self._init_components()
-        self._connect_signals()
     
     def _init_repositories(self):
         """Initialize repositories with database."""
@@ -74,39 +70,19 @@ class MainWindowPresenter:
             view=self.view
         )
     
-    def _connect_signals(self):
-        """Connect signals between components."""
-        # Connect event adapter signals to view components
-        if self.view and hasattr(self.view, 'generation_form'):
-            logger.debug("Connecting generation form signals")
-            
-            # Connect generation events from the event adapter to UI components
-            self.event_adapter.generation_started.connect(
-                self.view.generation_form._on_generation_started
-            )
-            
-            self.event_adapter.generation_completed.connect(
-                self.view.generation_form._on_generation_completed
-            )
-            
-            self.event_adapter.generation_failed.connect(
-                self.view.generation_form._on_generation_failed
-            )
-            
-            self.event_adapter.generation_canceled.connect(
-                self.view.generation_form._on_generation_canceled
-            )
-    
-    def start_generation(self, model: str, params: Dict[str, Any]) -> Optional[str]:
+    def start_generation(self, model: str, params: Dict[str, Any]) -> Optional[int]:
         """
         Start a new generation for the given model and parameters.
         
+        The prediction itself is created in the background and announced
+        through the event adapter's generation_started signal.
+        
         Args:
             model: Model identifier
             params: Generation parameters with prompt included
             
         Returns:
-            Prediction ID if successful, None otherwise
+            ID of the submitted order if successful, None otherwise
         """
         try:
             # Extract prompt from params for readability 
@@ -126,18 +102,18 @@ class MainWindowPresenter:
             )
             
             # Create an order instead of directly starting a generation
-            order, prediction_id = self.api_handler.create_order(
+            order, error = self.api_handler.create_order(
                 model=model,
                 prompt=prompt,
                 parameters=params
             )
             
-            if order and prediction_id:
+            if order:
                 if self.view:
-                    self.view.show_status(f"Started generation for order {order.id}")
-                return prediction_id
+                    self.view.show_status(f"Submitted order {order.id}")
+                return order.id
             else:
-                error_msg = "Failed to create order or start generation"
+                error_msg = error or "Failed to create order"
                 logger.error(error_msg)
                 if self.view:
                     self.view.show_error("Generation Error", error_msg)
@@ -148,71 +124,3 @@ class MainWindowPresenter:
             if self.view:
                 self.view.show_error("Generation Error", str(e))
             return None
-    
-    def _save_output_and_create_product(self, output: Any, prediction_id: str) -> Optional[Product]:
-        """
-        Save generation output to file and create product record.
-        
-        Args:
-            output: Raw output from generation
-            prediction_id: ID of the generation
-            
-        Returns:
-            Created Product or None if creation failed
-        """
-        try:
-            if not self.product_repository:
-                logger.warning("Product repository not available")
-                return None
-                
-            # Save output to file
-            output_dir = Path.home() / '.imagen-desktop' / 'products'
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Handle FileOutput objects from Replicate
-            if hasattr(output, 'read'):
-                data = output.read()
-            elif hasattr(output, 'url'):
-                # Download from URL
-                response = requests.get(output.url)
-                response.raise_for_status()
-                data = response.content
-            else:
-                # Assume string URL
-                response = requests.get(str(output))
-                response.raise_for_status()
-                data = response.content
-            
-            # Save to unique file
-            import uuid
-            file_path = output_dir / f"{uuid.uuid4()}.png"
-            with open(file_path, 'wb') as f:
-                f.write(data)
-            
-            # Get image dimensions
-            width = None
-            height = None
-            format_name = None
-            try:
-                from PIL import Image
-                with Image.open(file_path) as img:
-                    width, height = img.size
-                    format_name = img.format.lower() if img.format else None
-            except Exception as e:
-                logger.warning(f"Failed to get image dimensions: {e}")
-            
-            # Create product record
-            product = self.product_repository.create_product(
-                file_path=file_path,
-                generation_id=prediction_id,
-                width=width,
-                height=height,
-                format=format_name,
-                product_type=ProductType.IMAGE
-            )
-            
-            return product
-            
-        except Exception as e:
-            logger.error(f"Failed to create product: {e}")
-            return None
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Process-wide cache of decoded product pixmaps."""
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Tuple, Union
+import os
+
+from PyQt6.QtGui import QImageReader, QPixmap
+
+from imagen_desktop.utils.debug_logger import logger
+
+CacheKey = Tuple[str, int]
+
+class PixmapCache:
+    """LRU cache of full-size pixmaps bounded by their estimated memory use.
+
+    Entries are keyed by (path, mtime_ns) so a file rewritten on disk is
+    decoded again instead of serving a stale image.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Upper bound for the summed size of cached pixmaps
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Tuple[QPixmap, int]]" = OrderedDict()
+        self._keys_by_path: Dict[str, CacheKey] = {}
+        self._total_bytes = 0
+
+    @staticmethod
+    def _estimate_size(pixmap: QPixmap) -> int:
+        """Estimate the memory held by a decoded pixmap."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def get(self, path: Union[str, Path]) -> QPixmap:
+        """Get the decoded pixmap for a file, decoding it on first access.
+
+        Args:
+            path: Path to the image file
+
+        Returns:
+            The pixmap, or a null QPixmap if the file is missing or unreadable
+        """
+        path = str(path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self.invalidate(path)
+            return QPixmap()
+
+        key = (path, mtime_ns)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        # Decode through QImageReader rather than QPixmap(path), which would
+        # also keep a copy in Qt's global QPixmapCache
+        reader = QImageReader(path)
+        image = reader.read()
+        if image.isNull():
+            logger.warning(f"Failed to decode {path}: {reader.errorString()}")
+            return QPixmap()
+        pixmap = QPixmap.fromImage(image)
+
+        # Drop any entry decoded from an older version of the file
+        self.invalidate(path)
+
+        size = self._estimate_size(pixmap)
+        if size > self.max_bytes:
+            return pixmap
+
+        self._entries[key] = (pixmap, size)
+        self._keys_by_path[path] = key
+        self._total_bytes += size
+        self._evict()
+        return pixmap
+
+    def invalidate(self, path: Union[str, Path]):
+        """Remove the cached pixmap for a file, if any."""
+        key = self._keys_by_path.pop(str(path), None)
+        if key is not None:
+            _, size = self._entries.pop(key)
+            self._total_bytes -= size
+
+    def clear(self):
+        """Remove all cached pixmaps."""
+        self._entries.clear()
+        self._keys_by_path.clear()
+        self._total_bytes = 0
+
+    def _evict(self):
+        """Evict least recently used entries until under the byte budget."""
+        while self._total_bytes > self.max_bytes and self._entries:
+            (path, _), (_, size) = self._entries.popitem(last=False)
+            del self._keys_by_path[path]
+            self._total_bytes -= size
+            logger.debug("Evicted pixmap from cache: %s", path)
+
+# Shared instance used by all product views
+pixmap_cache = PixmapCache()
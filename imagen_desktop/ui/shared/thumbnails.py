@@ -0,0 +1,281 @@
+"""Decoding, disk caching and background loading of product thumbnails."""
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import hashlib
+import os
+import threading
+import uuid
+
+from PyQt6.QtCore import QObject, QRunnable, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+from imagen_desktop.utils.debug_logger import logger
+
+# Edge length in pixels of the square thumbnail box
+THUMBNAIL_SIZE = 200
+
+# Generated thumbnails, reused across refreshes and sessions
+THUMBNAIL_CACHE_DIR = Path.home() / '.imagen-desktop' / 'cache' / 'thumbnails'
+
+# JPEG quality for opaque cached thumbnails
+THUMBNAIL_JPEG_QUALITY = 85
+
+# Upper bound for the summed size of the cached thumbnail files
+THUMBNAIL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Guards _cache_bytes, which loader workers update concurrently
+_cache_lock = threading.Lock()
+
+# Summed size of the cache directory, or None until it is first scanned
+_cache_bytes: Optional[int] = None
+
+def thumbnail_cache_paths(path: Union[str, Path], size: int = THUMBNAIL_SIZE,
+                          stat: Optional[os.stat_result] = None) -> Tuple[Path, Path]:
+    """Get the candidate cache files for a source image's thumbnail.
+    
+    The key covers the source path, modification time and file size, so
+    replacing the source produces a new cache entry. Opaque thumbnails are
+    stored at the JPEG path and ones with transparency at the PNG path.
+    
+    Args:
+        path: Path to the image file
+        size: Maximum width and height of the thumbnail
+        stat: The source's stat result, if the caller already has it
+    
+    Returns:
+        The (JPEG, PNG) cache paths
+    
+    Raises:
+        OSError: If the source file cannot be stat()ed
+    """
+    if stat is None:
+        stat = os.stat(path)
+    key = f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{size}"
+    stem = THUMBNAIL_CACHE_DIR / hashlib.sha1(key.encode()).hexdigest()
+    return stem.with_suffix('.jpg'), stem.with_suffix('.png')
+
+def thumbnail_pixmap_key(path: Union[str, Path], mtime_ns: int, size: int = THUMBNAIL_SIZE) -> str:
+    """Get the QPixmapCache key for a source image's thumbnail."""
+    return f"{path}:{mtime_ns}:{size}"
+
+def load_thumbnail_image(path: Union[str, Path], size: int = THUMBNAIL_SIZE,
+                         stat: Optional[os.stat_result] = None) -> QImage:
+    """Load a thumbnail from the disk cache, generating it on a miss.
+    
+    Args:
+        path: Path to the image file
+        size: Maximum width and height of the thumbnail
+        stat: The source's stat result, if the caller already has it
+        
+    Returns:
+        The thumbnail image, or a null QImage if the file could not be read
+    """
+    try:
+        cache_paths = thumbnail_cache_paths(path, size, stat)
+    except OSError as e:
+        logger.warning(f"Failed to read thumbnail source {path}: {e}")
+        return QImage()
+    
+    for candidate in cache_paths:
+        image = QImage(str(candidate))
+        if not image.isNull():
+            _touch_cached_thumbnail(candidate)
+            return image
+    
+    image = decode_thumbnail_image(path, size)
+    if not image.isNull():
+        _write_cached_thumbnail(image, cache_paths)
+    return image
+
+def _write_cached_thumbnail(image: QImage, cache_paths: Tuple[Path, Path]):
+    """Save a thumbnail to the disk cache atomically.
+    
+    Opaque thumbnails are JPEG encoded, which is several times smaller and
+    faster to decode than PNG at this size; PNG is kept only for images
+    with an alpha channel. The image is written to a temporary file and
+    renamed into place, so a loader reading the same entry concurrently
+    never sees a partial file.
+    
+    Args:
+        image: The thumbnail to save
+        cache_paths: The (JPEG, PNG) cache paths from thumbnail_cache_paths
+    """
+    jpeg_path, png_path = cache_paths
+    if image.hasAlphaChannel():
+        cache_path = png_path
+        image_format, quality = 'PNG', -1
+    else:
+        cache_path = jpeg_path
+        image_format, quality = 'JPEG', THUMBNAIL_JPEG_QUALITY
+    
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if not image.save(str(tmp_path), image_format, quality):
+            raise OSError(f"could not write {tmp_path}")
+        os.replace(tmp_path, cache_path)
+        _record_cached_thumbnail(cache_path.stat().st_size)
+    except Exception as e:
+        logger.warning(f"Failed to cache thumbnail {cache_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+def _touch_cached_thumbnail(cache_path: Path):
+    """Mark a cache entry as recently used for pruning."""
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+def _record_cached_thumbnail(nbytes: int):
+    """Account for a newly written cache entry, pruning once over the cap.
+    
+    The directory is scanned on the first write of the session and again
+    only when the running total passes THUMBNAIL_CACHE_MAX_BYTES, so
+    ordinary writes cost no directory listing.
+    """
+    global _cache_bytes
+    with _cache_lock:
+        if _cache_bytes is not None and _cache_bytes + nbytes <= THUMBNAIL_CACHE_MAX_BYTES:
+            _cache_bytes += nbytes
+        else:
+            _cache_bytes = prune_thumbnail_cache()
+
+def prune_thumbnail_cache(max_bytes: Optional[int] = None) -> int:
+    """Remove the least recently used thumbnails once the cache is too big.
+    
+    Entries are ordered by modification time, which cache hits refresh;
+    access times are not used because many file systems do not update
+    them. Pruning stops at nine tenths of the cap, so the next few writes
+    do not trigger another scan. Temporary files of writes still in
+    progress are left alone.
+    
+    Args:
+        max_bytes: Size limit, THUMBNAIL_CACHE_MAX_BYTES if not given
+        
+    Returns:
+        The summed size of the entries left in the cache
+    """
+    if max_bytes is None:
+        max_bytes = THUMBNAIL_CACHE_MAX_BYTES
+    
+    entries = []
+    try:
+        with os.scandir(THUMBNAIL_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.tmp') or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    except FileNotFoundError:
+        return 0
+    
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return total
+    
+    target = max_bytes * 9 // 10
+    entries.sort()
+    for _, size, entry_path in entries:
+        if total <= target:
+            break
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to prune cached thumbnail {entry_path}: {e}")
+            continue
+        total -= size
+    
+    logger.debug(f"Pruned thumbnail cache to {total} bytes")
+    return total
+
+def remove_cached_thumbnail(path: Union[str, Path], size: int = THUMBNAIL_SIZE,
+                            stat: Optional[os.stat_result] = None):
+    """Remove a source image's thumbnail from the disk cache.
+    
+    The cache key needs the source's stat, so call this while the source
+    still exists or pass a stat taken earlier. Entries of sources that are
+    already gone are left to pruning.
+    
+    Args:
+        path: Path to the image file
+        size: Maximum width and height of the thumbnail
+        stat: The source's stat result, if the caller already has it
+    """
+    global _cache_bytes
+    try:
+        cache_paths = thumbnail_cache_paths(path, size, stat)
+    except OSError:
+        return
+    
+    for cache_path in cache_paths:
+        try:
+            nbytes = cache_path.stat().st_size
+            cache_path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(f"Failed to remove cached thumbnail {cache_path}: {e}")
+            continue
+        with _cache_lock:
+            if _cache_bytes is not None:
+                _cache_bytes = max(0, _cache_bytes - nbytes)
+
+def decode_thumbnail_image(path: Union[str, Path], size: int = THUMBNAIL_SIZE) -> QImage:
+    """Decode an image file straight to thumbnail size.
+    
+    The target size is set on the reader before decoding, so formats that
+    support scaled decoding (JPEG) never materialize the full resolution
+    image. EXIF orientation is applied.
+    
+    Args:
+        path: Path to the image file
+        size: Maximum width and height of the thumbnail
+        
+    Returns:
+        The thumbnail image, or a null QImage if the file could not be read
+    """
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    
+    source_size = reader.size()
+    if source_size.isValid() and (source_size.width() > size or source_size.height() > size):
+        reader.setScaledSize(
+            source_size.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+    
+    image = reader.read()
+    if image.isNull():
+        logger.warning(f"Failed to decode thumbnail for {path}: {reader.errorString()}")
+    return image
+
+class ThumbnailLoaderSignals(QObject):
+    """Signals emitted by ThumbnailLoader."""
+    loaded = pyqtSignal(str, QImage)  # source path, thumbnail (null on failure)
+
+class ThumbnailLoader(QRunnable):
+    """Loads a thumbnail on a thread pool worker.
+    
+    Setting the cancelled event before the loader runs skips the decode,
+    so thumbnails discarded while still queued cost no worker time.
+    """
+    
+    def __init__(self, path: Union[str, Path], size: int = THUMBNAIL_SIZE,
+                 stat: Optional[os.stat_result] = None):
+        super().__init__()
+        self.path = str(path)
+        self.size = size
+        self.stat = stat
+        self.signals = ThumbnailLoaderSignals()
+        self.cancelled = threading.Event()
+    
+    def run(self):
+        """Load the thumbnail and deliver it to the GUI thread."""
+        if self.cancelled.is_set():
+            return
+        image = load_thumbnail_image(self.path, self.size, self.stat)
+        self.signals.loaded.emit(self.path, image)
@@ -1,22 +1,66 @@
 """Base widget for displaying product thumbnails."""
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
-from PyQt6.QtCore import Qt
-from typing import List
+from PyQt6.QtCore import Qt, QCoreApplication, QEvent, QRect, QTimer
+from typing import List, Optional, Set, Tuple
 from pathlib import Path
+import importlib
 
 from imagen_desktop.core.models.product import Product
 from imagen_desktop.core.events.product_events import ProductEvent, ProductEventType, ProductEventPublisher
-from imagen_desktop.ui.shared.widgets.product_thumbnail import ProductThumbnail
+from imagen_desktop.ui.shared.widgets.product_thumbnail import ProductThumbnail, THUMBNAIL_STYLE
 from imagen_desktop.utils.debug_logger import logger
+from imagen_desktop.utils.fs import directory_signature, existing_paths
+
+# Modules imported on first right-click, warmed up once the UI is idle
+_DEFERRED_IMPORTS = (
+    'imagen_desktop.ui.shared.widgets.product_context_menu',
+    'imagen_desktop.ui.features.gallery.dialogs.product_viewer',
+)
+
+def _prewarm_imports():
+    """Import modules that are otherwise loaded on first user interaction."""
+    for module in _DEFERRED_IMPORTS:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Failed to prewarm {module}: {e}")
 
 class BaseProductDisplay(QWidget):
     """Base class for product thumbnail displays."""
     
+    # Delay in ms before deferred imports are warmed up
+    PREWARM_DELAY_MS = 500
+    
+    # Viewports' worth of thumbnails to load ahead of the visible area
+    PREFETCH_VIEWPORTS = 1
+    
+    # Thumbnails further than this many viewports away release their pixmaps
+    RELEASE_VIEWPORTS = 4
+    
+    # Most thumbnail widgets created per event loop pass when listing
+    RENDER_BATCH_SIZE = 48
+    
+    # Minimum interval in ms between visibility passes while scrolling
+    SCROLL_THROTTLE_MS = 50
+    
     def __init__(self):
         super().__init__()
         self.thumbnails = []
+        self._listing_signature = None
+        self._pending_listing = None  # Listing still gaining widgets
+        self._requested_thumbnails: Set[ProductThumbnail] = set()
+        self._layout_changed = False  # Widgets placed since the last pass
+        
+        # The first scroll step in a burst starts this timer and later ones
+        # join it, so fast scrolling runs one pass per interval
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(self.SCROLL_THROTTLE_MS)
+        self._scroll_timer.timeout.connect(self._load_visible_thumbnails)
+        
         self._init_base_ui()
         self._connect_events()
+        QTimer.singleShot(self.PREWARM_DELAY_MS, _prewarm_imports)
     
     def _init_base_ui(self):
         """Initialize base UI components."""
@@ -30,11 +74,16 @@ class BaseProductDisplay(QWidget):
         
         # Create content widget
         self.scroll_content = QWidget()
+        self.scroll_content.setStyleSheet(THUMBNAIL_STYLE)
         self.content_layout = self._create_layout()
         self.scroll_content.setLayout(self.content_layout)
         
         self.scroll.setWidget(self.scroll_content)
         layout.addWidget(self.scroll)
+        
+        # Thumbnails decode only once scrolled into view
+        self.scroll.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.scroll.horizontalScrollBar().valueChanged.connect(self._on_scrolled)
     
     def _connect_events(self):
         """Subscribe to product events."""
@@ -51,14 +100,44 @@ class BaseProductDisplay(QWidget):
             )
     
     def _handle_product_deleted(self, product: Product):
-        """Handle product deletion."""
-        # Find and remove thumbnail
-        for thumbnail in self.thumbnails[:]:  # Copy list for safe removal
-            if thumbnail.product.id == product.id:
-                thumbnail.deleteLater()
+        """Handle product deletion.
+        
+        The display is the only subscriber that removes the thumbnail;
+        views embedding it just react to the deletion.
+        """
+        self.remove_product(product.id)
+    
+    def remove_product(self, product_id: int) -> bool:
+        """Remove a single product's thumbnail without reloading the others.
+        
+        Args:
+            product_id: ID of the product to remove
+            
+        Returns:
+            True if a thumbnail was removed
+        """
+        removed = False
+        if self._pending_listing is not None:
+            # Don't create a widget for it in a later batch either
+            pending = [entry for entry in self._pending_listing if entry[0].id != product_id]
+            removed = len(pending) < len(self._pending_listing)
+            self._pending_listing = pending
+        
+        for thumbnail in self.thumbnails:
+            if thumbnail.product.id == product_id:
+                self._listing_signature = None
                 self.thumbnails.remove(thumbnail)
-                logger.debug(f"Removed thumbnail for product {product.id}")
-                break
+                self._discard_thumbnail(thumbnail)
+                
+                # Close the gap left behind
+                self._layout_thumbnails(self.thumbnails)
+                self._schedule_visible_load()
+                logger.debug("Removed thumbnail for product %s", product_id)
+                return True
+        
+        if removed:
+            self._listing_signature = None
+        return removed
     
     def _create_layout(self):
         """Create the layout for thumbnails. Override in subclasses."""
@@ -68,31 +147,214 @@ class BaseProductDisplay(QWidget):
         """Add thumbnail to layout. Override in subclasses."""
         raise NotImplementedError
     
+    def _layout_thumbnails(self, thumbnails: List[ProductThumbnail]):
+        """Place existing thumbnails in the given order. Override in subclasses."""
+        raise NotImplementedError
+    
+    def _create_thumbnail(self, product: Product) -> ProductThumbnail:
+        """Create a thumbnail widget for a product."""
+        thumbnail = ProductThumbnail(product, lazy=True)
+        thumbnail.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        thumbnail.customContextMenuRequested.connect(self._show_context_menu)
+        return thumbnail
+    
+    def _discard_thumbnail(self, thumbnail: ProductThumbnail):
+        """Take a thumbnail out of the layout and delete it."""
+        self._requested_thumbnails.discard(thumbnail)
+        self.content_layout.removeWidget(thumbnail)
+        thumbnail.cancel_load()
+        thumbnail.deleteLater()
+    
     def _add_thumbnail(self, product: Product, position=None):
         """Add a thumbnail to the layout."""
-        thumbnail = ProductThumbnail(product)
-        thumbnail.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        thumbnail.customContextMenuRequested.connect(
-            lambda pos, p=product: self._show_context_menu(pos, p)
-        )
-        
+        # A later batch would drop or move a widget added mid-listing
+        self._finish_pending_listing()
+        self._listing_signature = None
+        thumbnail = self._create_thumbnail(product)
         self._add_to_layout(thumbnail, position)
+        thumbnail.show()
         self.thumbnails.append(thumbnail)
+        self._schedule_visible_load()
         
-    def _show_context_menu(self, pos, product: Product):
-        """Show context menu for a thumbnail."""
+    def _show_context_menu(self, pos):
+        """Show context menu for the thumbnail that requested it."""
         from imagen_desktop.ui.shared.widgets.product_context_menu import ProductContextMenu
-        menu = ProductContextMenu(product, self)
-        menu.exec(self.sender().mapToGlobal(pos))
-    
-    def set_products(self, products: List[Product]):
-        """Set the products to display."""
-        self.clear()
-        for product in products:
-            file_path = Path(product.file_path)
-            if file_path.exists():
-                self._add_thumbnail(product)
-        logger.debug(f"Added {len(self.thumbnails)} products to display")
+        thumbnail = self.sender()
+        menu = ProductContextMenu(thumbnail.product, self)
+        menu.exec(thumbnail.mapToGlobal(pos))
+    
+    def set_products(self, products: List[Product], force: bool = False):
+        """Set the products to display.
+        
+        Thumbnails already showing a product are kept and reordered; only
+        new products get widgets and only removed ones are deleted. New
+        widgets are created RENDER_BATCH_SIZE at a time, one batch per
+        event loop pass, so a large first listing doesn't stall the GUI.
+        If the listing and its directories' mtimes match the previous call,
+        the display is left as is.
+        
+        Args:
+            products: Products to display, in order
+            force: Reconcile even if nothing appears to have changed
+        """
+        paths = [str(product.file_path) for product in products]
+        signature = (
+            tuple(product.id for product in products),
+            tuple(paths),
+            directory_signature(paths)
+        )
+        if not force and signature == self._listing_signature:
+            return
+        self._listing_signature = signature
+        self._pending_listing = None
+        
+        found = existing_paths(paths)
+        listing = [
+            (product, path) for product, path in zip(products, paths)
+            if path in found
+        ]
+        self._render_listing(listing)
+    
+    def _render_listing(self, listing: List[Tuple[Product, str]],
+                        batch_size: Optional[int] = None):
+        """Reconcile the thumbnails with a listing of existing files.
+        
+        Creates at most batch_size new widgets and, if more are needed,
+        schedules another pass; products still waiting for a widget are
+        skipped until then.
+        
+        Args:
+            listing: Products to display with their file paths, in order
+            batch_size: Most widgets to create, RENDER_BATCH_SIZE by default
+        """
+        if batch_size is None:
+            batch_size = self.RENDER_BATCH_SIZE
+        existing = {thumbnail.product.id: thumbnail for thumbnail in self.thumbnails}
+        ordered = []
+        created: List[ProductThumbnail] = []
+        deferred = False
+        for product, path in listing:
+            thumbnail = existing.pop(product.id, None)
+            if thumbnail is not None and str(thumbnail.product.file_path) == path:
+                thumbnail.product = product
+            else:
+                if thumbnail is not None:
+                    existing[product.id] = thumbnail
+                if len(created) == batch_size:
+                    deferred = True
+                    continue
+                thumbnail = self._create_thumbnail(product)
+                created.append(thumbnail)
+            ordered.append(thumbnail)
+        
+        if deferred:
+            self._pending_listing = listing
+            QTimer.singleShot(0, self._continue_listing)
+        
+        if ordered == self.thumbnails:
+            # Nothing added, removed or moved
+            return
+        
+        # Rebuild the layout in one pass without repainting per widget
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            # Remove thumbnails for products no longer listed
+            for thumbnail in existing.values():
+                self._discard_thumbnail(thumbnail)
+            
+            self.thumbnails = ordered
+            self._layout_thumbnails(ordered)
+            
+            # Show new widgets now rather than on the layout's queued show,
+            # so the next pass can lay them out and see where they are
+            for thumbnail in created:
+                thumbnail.show()
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+        self._schedule_visible_load()
+        logger.debug(
+            f"Displaying {len(ordered)} products "
+            f"({len(created)} added, {len(existing)} removed)"
+        )
+    
+    def _continue_listing(self):
+        """Create the next batch of widgets for a listing still pending."""
+        listing = self._pending_listing
+        if listing is not None:
+            self._pending_listing = None
+            self._render_listing(listing)
+    
+    def _finish_pending_listing(self):
+        """Create every widget still pending for a listing, right away."""
+        listing = self._pending_listing
+        if listing is not None:
+            self._pending_listing = None
+            self._render_listing(listing, batch_size=len(listing))
+    
+    def _schedule_visible_load(self):
+        """Load visible thumbnails once the layout has placed them."""
+        self._layout_changed = True
+        QTimer.singleShot(0, self._load_visible_thumbnails)
+    
+    def _on_scrolled(self):
+        """Load thumbnails scrolled into view, at most once per interval."""
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+    
+    def _thumbnail_range(self, rect: QRect) -> Tuple[int, int]:
+        """Get the slice of thumbnails that may intersect an area.
+        
+        Subclasses with a regular layout narrow this down from their
+        geometry; the default covers every thumbnail.
+        
+        Args:
+            rect: Area in content coordinates
+            
+        Returns:
+            Start and end indices into self.thumbnails
+        """
+        return 0, len(self.thumbnails)
+    
+    def _load_visible_thumbnails(self):
+        """Start loading thumbnails in and around the scroll viewport.
+        
+        Thumbnails within PREFETCH_VIEWPORTS of the visible area are queued
+        in the same pass, so they are usually decoded before scrolling
+        reaches them. Thumbnails beyond RELEASE_VIEWPORTS drop their
+        pixmaps, keeping decoded memory proportional to the viewport;
+        scrolling back reloads them from the pixmap or disk cache. Only
+        the thumbnails near the viewport and those holding pixmaps are
+        visited, so a pass costs the same however long the listing is.
+        """
+        if self._layout_changed:
+            # Lay out widgets added since the last pass and let the scroll
+            # area grow the content to fit them; until then new thumbnails
+            # are squeezed into the viewport and would all appear visible
+            self._layout_changed = False
+            self.content_layout.activate()
+            QCoreApplication.sendPostedEvents(self.scroll.viewport(), QEvent.Type.LayoutRequest)
+        visible = self.scroll_content.visibleRegion().boundingRect()
+        if visible.isEmpty():
+            return
+        
+        margin_x = visible.width() * self.PREFETCH_VIEWPORTS
+        margin_y = visible.height() * self.PREFETCH_VIEWPORTS
+        wanted = visible.adjusted(-margin_x, -margin_y, margin_x, margin_y)
+        
+        release_x = visible.width() * self.RELEASE_VIEWPORTS
+        release_y = visible.height() * self.RELEASE_VIEWPORTS
+        retained = visible.adjusted(-release_x, -release_y, release_x, release_y)
+        
+        for thumbnail in list(self._requested_thumbnails):
+            if not thumbnail.geometry().intersects(retained):
+                thumbnail.release_thumbnail()
+                self._requested_thumbnails.discard(thumbnail)
+        
+        start, end = self._thumbnail_range(wanted)
+        for thumbnail in self.thumbnails[start:end]:
+            if not thumbnail.thumbnail_requested and thumbnail.geometry().intersects(wanted):
+                thumbnail.load_thumbnail()
+                self._requested_thumbnails.add(thumbnail)
     
     def add_product(self, product: Product, position=None):
         """Add a single product."""
@@ -103,8 +365,12 @@ class BaseProductDisplay(QWidget):
     def clear(self):
         """Remove all thumbnails."""
         for thumbnail in self.thumbnails:
+            thumbnail.cancel_load()
             thumbnail.deleteLater()
         self.thumbnails.clear()
+        self._requested_thumbnails.clear()
+        self._listing_signature = None
+        self._pending_listing = None
         
         # Clear layout (implementation specific)
         self._clear_layout()
@@ -113,6 +379,16 @@ class BaseProductDisplay(QWidget):
         """Clear the layout. Override in subclasses."""
         raise NotImplementedError
         
+    def showEvent(self, event):
+        """Load thumbnails that became visible with the widget."""
+        super().showEvent(event)
+        self._schedule_visible_load()
+    
+    def resizeEvent(self, event):
+        """Load thumbnails revealed by a larger viewport."""
+        super().resizeEvent(event)
+        self._schedule_visible_load()
+    
     def closeEvent(self, event):
         """Clean up event subscriptions."""
         ProductEventPublisher.unsubscribe_from_products(self._handle_product_event)
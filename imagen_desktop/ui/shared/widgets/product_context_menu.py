@@ -1,12 +1,14 @@
 """Context menu for product thumbnails."""
 from PyQt6.QtWidgets import QMenu, QMessageBox, QFileDialog
-from PyQt6.QtGui import QClipboard, QPixmap
+from PyQt6.QtGui import QGuiApplication
 from pathlib import Path
+import shutil
 
 from imagen_desktop.core.models.product import Product
 from imagen_desktop.core.events.product_events import (
     ProductEvent, ProductEventType, ProductEventPublisher
 )
+from imagen_desktop.ui.shared.pixmap_cache import pixmap_cache
 from imagen_desktop.utils.debug_logger import logger
 
 class ProductContextMenu(QMenu):
@@ -47,8 +49,8 @@ class ProductContextMenu(QMenu):
         """Copy product to clipboard."""
         try:
             file_path = Path(self.product.file_path) if isinstance(self.product.file_path, str) else self.product.file_path
-            clipboard = QClipboard()
-            pixmap = QPixmap(str(file_path))
+            clipboard = QGuiApplication.clipboard()
+            pixmap = pixmap_cache.get(file_path)
             clipboard.setPixmap(pixmap)
             logger.debug(f"Copied product {self.product.id} to clipboard")
         except Exception as e:
@@ -71,8 +73,7 @@ class ProductContextMenu(QMenu):
         
         if file_name:
             try:
-                import shutil
-                shutil.copy2(file_path, file_name)
+                shutil.copyfile(file_path, file_name)
                 logger.debug(f"Saved product {self.product.id} to {file_name}")
             except Exception as e:
                 logger.error(f"Failed to save product: {e}")
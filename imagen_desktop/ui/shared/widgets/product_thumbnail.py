@@ -1,37 +1,79 @@
 """Thumbnail widget for displaying a product."""
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QPixmap, QMouseEvent
+from PyQt6.QtCore import Qt, QSize, QThreadPool
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QMouseEvent
 from pathlib import Path
+import os
 
 from imagen_desktop.core.models.product import Product
 from imagen_desktop.core.events.product_events import (
     ProductEvent, ProductEventType, ProductEventPublisher
 )
+from imagen_desktop.ui.shared.thumbnails import (
+    THUMBNAIL_SIZE, ThumbnailLoader, thumbnail_pixmap_key
+)
 from imagen_desktop.utils.debug_logger import logger
 
+# Applied once to a thumbnail container rather than parsed per widget
+THUMBNAIL_STYLE = """
+    QLabel#productThumbnail {
+        border: 1px solid #ccc;
+        background-color: #f0f0f0;
+        border-radius: 4px;
+        padding: 2px;
+    }
+    QLabel#productThumbnail:hover {
+        border-color: #999;
+        background-color: #e5e5e5;
+    }
+    QLabel#productThumbnail[error="true"] {
+        color: #721c24;
+        background-color: #f8d7da;
+        border-color: #f5c6cb;
+    }
+"""
+
 class ProductThumbnail(QLabel):
     """Widget displaying a thumbnail of a product."""
     
-    def __init__(self, product: Product, parent=None):
+    def __init__(self, product: Product, parent=None, lazy: bool = False):
+        """Initialize the thumbnail.
+        
+        Args:
+            product: Product to display
+            parent: Optional parent widget
+            lazy: Defer loading the image until load_thumbnail() is called
+        """
         super().__init__(parent)
         self.product = product
-        self.setFixedSize(QSize(200, 200))
+        self.thumbnail_requested = False
+        self._pixmap_key = None
+        self._load_cancelled = None
+        self.setFixedSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet("""
-            QLabel {
-                border: 1px solid #ccc;
-                background-color: #f0f0f0;
-                border-radius: 4px;
-                padding: 2px;
-            }
-            QLabel:hover {
-                border-color: #999;
-                background-color: #e5e5e5;
-            }
-        """)
+        # Styled by THUMBNAIL_STYLE on the containing display
+        self.setObjectName("productThumbnail")
+        if not lazy:
+            self.load_thumbnail()
+    
+    def load_thumbnail(self):
+        """Start loading the thumbnail image, once."""
+        if self.thumbnail_requested:
+            return
+        self.thumbnail_requested = True
         self._load_thumbnail()
     
+    def release_thumbnail(self):
+        """Drop the displayed pixmap so it can be loaded again later."""
+        self.cancel_load()
+        self.clear()
+        self.thumbnail_requested = False
+    
+    def cancel_load(self):
+        """Skip a queued thumbnail decode that has not started yet."""
+        if self._load_cancelled is not None:
+            self._load_cancelled.set()
+    
     def _load_thumbnail(self):
         """Load and display the product thumbnail."""
         try:
@@ -40,7 +82,9 @@ class ProductThumbnail(QLabel):
             if isinstance(file_path, str):
                 file_path = Path(file_path)
             
-            if not file_path.exists():
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
                 logger.error(
                     "Failed to load thumbnail - file not found",
                     extra={
@@ -53,33 +97,26 @@ class ProductThumbnail(QLabel):
                 self._show_error("File not found")
                 return
                 
-            pixmap = QPixmap(str(file_path))
-            if pixmap.isNull():
-                logger.error(
-                    "Failed to load thumbnail - invalid image data",
-                    extra={
-                        'context': {
-                            'product_id': self.product.id,
-                            'file_path': str(file_path)
-                        }
-                    }
-                )
-                self._show_error("Invalid image")
-                return
-            
-            scaled_pixmap = pixmap.scaled(
-                self.size(), 
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.setPixmap(scaled_pixmap)
-            
             # Store original dimensions for tooltip
             self.setToolTip(
                 f"Size: {self.product.width}x{self.product.height}\n"
                 f"Format: {self.product.format}"
             )
             
+            # Reuse a pixmap already decoded for another view of this file
+            self._pixmap_key = thumbnail_pixmap_key(file_path, stat.st_mtime_ns)
+            pixmap = QPixmapCache.find(self._pixmap_key)
+            if pixmap is not None:
+                self.setPixmap(pixmap)
+                return
+            
+            # Decode on the thread pool; the label stays blank until it arrives.
+            # The stat is passed along so the worker needn't repeat it.
+            loader = ThumbnailLoader(file_path, stat=stat)
+            loader.signals.loaded.connect(self._apply_thumbnail)
+            self._load_cancelled = loader.cancelled
+            QThreadPool.globalInstance().start(loader)
+            
         except Exception as e:
             logger.error(
                 "Failed to load thumbnail",
@@ -92,16 +129,39 @@ class ProductThumbnail(QLabel):
             )
             self._show_error("Error loading image")
     
+    def _apply_thumbnail(self, file_path: str, image: QImage):
+        """Show a thumbnail delivered by the loader."""
+        if not self.thumbnail_requested:
+            # Released while the decode was in flight
+            return
+        
+        if image.isNull():
+            logger.error(
+                "Failed to load thumbnail - invalid image data",
+                extra={
+                    'context': {
+                        'product_id': self.product.id,
+                        'file_path': file_path
+                    }
+                }
+            )
+            self._show_error("Invalid image")
+            return
+        
+        pixmap = QPixmap.fromImage(image)
+        if self._pixmap_key:
+            QPixmapCache.insert(self._pixmap_key, pixmap)
+        self.setPixmap(pixmap)
+    
     def _show_error(self, message: str):
         """Display error state."""
         self.setText(message)
-        self.setStyleSheet(self.styleSheet() + """
-            QLabel {
-                color: #721c24;
-                background-color: #f8d7da;
-                border-color: #f5c6cb;
-            }
-        """)
+        # Switch to the error rule of THUMBNAIL_STYLE
+        self.setProperty("error", True)
+        style = self.style()
+        if style is not None:
+            style.unpolish(self)
+            style.polish(self)
     
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press events."""
@@ -113,7 +173,7 @@ class ProductThumbnail(QLabel):
             if self.product is not None:
                 try:
                     # Emit product selection event
-                    logger.debug(f"Selected product {self.product.id}")
+                    logger.debug("Selected product %s", self.product.id)
                     selection_event = ProductEvent(
                         event_type=ProductEventType.SELECTED,
                         product=self.product
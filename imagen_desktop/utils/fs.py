@@ -0,0 +1,63 @@
+"""Filesystem helpers for working with many files at once."""
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+import os
+
+from imagen_desktop.utils.debug_logger import logger
+
+PathLike = TypeVar('PathLike', str, Path)
+
+def _group_by_parent(paths: Iterable[PathLike]) -> Dict[str, List[PathLike]]:
+    """Group paths by their parent directory, keeping the caller's objects."""
+    groups: Dict[str, List[PathLike]] = defaultdict(list)
+    for path in paths:
+        groups[os.path.dirname(os.fspath(path)) or '.'].append(path)
+    return groups
+
+def existing_paths(paths: Iterable[PathLike]) -> Set[PathLike]:
+    """Get the subset of paths that exist, listing each directory once.
+    
+    Membership comes from the directory listing itself, so no file is
+    stat()ed individually.
+    
+    Args:
+        paths: Paths to check, as str or Path
+        
+    Returns:
+        Set of the given path objects that exist
+    """
+    found: Set[PathLike] = set()
+    for parent, children in _group_by_parent(paths).items():
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except OSError as e:
+            logger.debug(f"Could not list {parent}: {e}")
+            continue
+        found.update(
+            path for path in children
+            if os.path.basename(os.fspath(path)) in names
+        )
+    return found
+
+def directory_signature(paths: Iterable[PathLike]) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Get the modification times of the directories holding paths.
+    
+    Adding, removing or renaming a file changes its directory's mtime, so
+    an unchanged signature means the set of files is unchanged.
+    
+    Args:
+        paths: Paths whose parent directories to stat, as str or Path
+        
+    Returns:
+        Sorted (directory, st_mtime_ns) pairs; unreadable directories
+        have None as their mtime
+    """
+    signature: List[Tuple[str, Optional[int]]] = []
+    for parent in sorted(_group_by_parent(paths)):
+        try:
+            signature.append((parent, os.stat(parent).st_mtime_ns))
+        except OSError:
+            signature.append((parent, None))
+    return tuple(signature)
@@ -0,0 +1,69 @@
+"""Helpers for reading basic image metadata."""
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional, Union
+import struct
+
+from PIL import Image
+
+from imagen_desktop.utils.debug_logger import logger
+
+class ImageMeta(NamedTuple):
+    """Dimensions and format of an image file."""
+    width: Optional[int] = None
+    height: Optional[int] = None
+    format: Optional[str] = None
+
+# Signature opening every PNG file
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Bytes covering the PNG signature and the IHDR chunk's width and height
+PNG_HEADER_SIZE = 24
+
+def probe_png_header(head: bytes) -> Optional[ImageMeta]:
+    """Read PNG dimensions straight from the start of a file.
+    
+    Args:
+        head: At least the first PNG_HEADER_SIZE bytes of the file
+        
+    Returns:
+        ImageMeta, or None if head is not the start of a PNG
+    """
+    if (len(head) < PNG_HEADER_SIZE or not head.startswith(PNG_SIGNATURE)
+            or head[12:16] != b'IHDR'):
+        return None
+    width, height = struct.unpack('>II', head[16:PNG_HEADER_SIZE])
+    return ImageMeta(width, height, 'png')
+
+def _read_head(source: Union[str, Path, BinaryIO]) -> bytes:
+    """Read the first bytes of a file, leaving file objects where they were."""
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            return f.read(PNG_HEADER_SIZE)
+    position = source.tell()
+    head = source.read(PNG_HEADER_SIZE)
+    source.seek(position)
+    return head
+
+def probe_image(source: Union[str, Path, BinaryIO]) -> ImageMeta:
+    """Read image size and format in a single header pass.
+    
+    PNG headers are parsed directly; other formats are identified by
+    Pillow. The image data itself is never decoded.
+    
+    Args:
+        source: Path to the image, or a binary file object
+        
+    Returns:
+        ImageMeta, with all fields None if the image could not be read
+    """
+    try:
+        meta = probe_png_header(_read_head(source))
+        if meta is not None:
+            return meta
+        
+        with Image.open(source) as img:
+            width, height = img.size
+            return ImageMeta(width, height, img.format.lower() if img.format else None)
+    except Exception as e:
+        logger.warning(f"Failed to get image dimensions: {e}")
+        return ImageMeta()
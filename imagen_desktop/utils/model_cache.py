@@ -0,0 +1,111 @@
+"""On-disk cache of model listings fetched from Replicate."""
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+import time
+import uuid
+
+from imagen_desktop.utils.debug_logger import logger
+
+# Cached listings, one JSON file per collection
+MODEL_CACHE_DIR = Path.home() / '.imagen-desktop' / 'cache'
+
+# Age in seconds after which a cached listing should be revalidated
+MODEL_CACHE_TTL = 24 * 60 * 60
+
+def _cache_path(kind: str) -> Path:
+    """Get the cache file for a model collection."""
+    return MODEL_CACHE_DIR / f"models-{kind}.json"
+
+def listing_checksum(models: List[Dict[str, Any]]) -> str:
+    """Get a checksum identifying the contents of a model listing."""
+    data = json.dumps(models, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+def _cached_checksum(path: Path) -> Optional[str]:
+    """Get the checksum stored with a cached listing, if any."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get('checksum')
+    except Exception:
+        return None
+
+def load_cached_models(kind: str) -> Optional[List[Dict[str, Any]]]:
+    """Load a cached model listing.
+
+    Args:
+        kind: Collection the listing was fetched from, e.g. 'text-to-image'
+
+    Returns:
+        The cached models, or None if nothing usable is cached
+    """
+    path = _cache_path(kind)
+    try:
+        with open(path, 'r') as f:
+            models = json.load(f).get('models')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read model cache {path}: {e}")
+        return None
+
+    return models if isinstance(models, list) else None
+
+def is_listing_unchanged(kind: str, models: List[Dict[str, Any]]) -> bool:
+    """Check whether a listing matches the one already cached.
+
+    Args:
+        kind: Collection the listing was fetched from
+        models: Freshly fetched models
+
+    Returns:
+        True if the cached listing has the same contents
+    """
+    return _cached_checksum(_cache_path(kind)) == listing_checksum(models)
+
+def touch_cached_models(kind: str) -> None:
+    """Restart the TTL of a cached listing without rewriting it."""
+    path = _cache_path(kind)
+    try:
+        os.utime(path)
+    except OSError as e:
+        logger.warning(f"Failed to touch model cache {path}: {e}")
+
+def save_cached_models(kind: str, models: List[Dict[str, Any]]) -> None:
+    """Save a model listing to the cache.
+
+    The file is written under a temporary name and renamed into place, so
+    readers never see a partial listing.
+
+    Args:
+        kind: Collection the listing was fetched from
+        models: Models to cache
+    """
+    path = _cache_path(kind)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump({'checksum': listing_checksum(models), 'models': models}, f)
+        os.replace(tmp_path, path)
+        logger.debug(f"Cached {len(models)} {kind} models")
+    except Exception as e:
+        logger.warning(f"Failed to write model cache {path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+def has_cached_models(kind: str) -> bool:
+    """Check whether a listing has been cached for a model collection."""
+    return _cache_path(kind).exists()
+
+def is_cache_stale(kind: str, ttl: float = MODEL_CACHE_TTL) -> bool:
+    """Check whether a cached listing is missing or older than ttl seconds."""
+    try:
+        age = time.time() - os.stat(_cache_path(kind)).st_mtime
+    except OSError:
+        return True
+    return age > ttl
@@ -51,16 +51,26 @@ def mock_prediction_manager():
 
 
 @pytest.fixture
-def api_handler(mock_repositories):
+def api_handler(mock_repositories, tmp_path):
     """Create an APIHandler with mocked repositories."""
     handler = APIHandler(
         order_repository=mock_repositories["order"],
         generation_repository=mock_repositories["generation"],
         product_repository=mock_repositories["product"]
     )
+    # Keep saved outputs out of the user's products folder
+    handler._output_dir = tmp_path
     return handler
 
 
+@pytest.fixture
+def inline_thread_pool():
+    """Run tasks handed to the thread pool immediately on the calling thread."""
+    with patch("imagen_desktop.api.api_handler.QThreadPool") as mock_pool:
+        mock_pool.globalInstance.return_value.start.side_effect = lambda task: task()
+        yield mock_pool
+
+
 @pytest.mark.api
 class TestAPIHandler:
     """Tests for the APIHandler class."""
@@ -79,7 +89,7 @@ class TestAPIHandler:
         assert handler.generation_repository == mock_repositories["generation"]
         assert handler.product_repository == mock_repositories["product"]
         assert isinstance(handler, QObject)
-        assert isinstance(handler._active_predictions, set)
+        assert isinstance(handler._active_predictions, dict)
         assert len(handler._active_predictions) == 0
         
     def test_init_components(self, api_handler):
@@ -108,7 +118,7 @@ class TestAPIHandler:
             api_handler._handle_generation_canceled
         )
     
-    def test_create_order_success(self, api_handler, mock_repositories):
+    def test_create_order_success(self, api_handler, mock_repositories, inline_thread_pool):
         """Test creating an order successfully."""
         # Mock order and generation repositories
         mock_order = MagicMock(spec=Order)
@@ -118,9 +128,11 @@ class TestAPIHandler:
         mock_generation = MagicMock(spec=Generation)
         mock_repositories["generation"].create_generation.return_value = mock_generation
         
-        # Mock prediction_manager.start_prediction
+        # Mock prediction creation and tracking
+        mock_prediction = MagicMock()
         api_handler.prediction_manager = MagicMock(spec=PredictionManager)
-        api_handler.prediction_manager.start_prediction.return_value = "pred_123"
+        api_handler.prediction_manager.create_prediction.return_value = mock_prediction
+        api_handler.prediction_manager.track_prediction.return_value = "pred_123"
         
         # Mock event publishers
         with patch("imagen_desktop.api.api_handler.OrderEventPublisher") as mock_order_publisher_class:
@@ -132,11 +144,12 @@ class TestAPIHandler:
                 prompt = "A beautiful sunset"
                 parameters = {"width": 1024, "height": 1024, "num_outputs": 1}
                 
-                order, prediction_id = api_handler.create_order(model, prompt, parameters)
+                order, error = api_handler.create_order(model, prompt, parameters)
+                api_handler._writes.join()
                 
                 # Verify results
                 assert order == mock_order
-                assert prediction_id == "pred_123"
+                assert error is None
                 
                 # Verify repository calls
                 mock_repositories["order"].create_order.assert_called_once_with(
@@ -161,8 +174,9 @@ class TestAPIHandler:
                     status=OrderStatus.PROCESSING
                 )
                 
-                # Verify prediction manager call
-                api_handler.prediction_manager.start_prediction.assert_called_once_with(model, parameters)
+                # Verify prediction manager calls
+                api_handler.prediction_manager.create_prediction.assert_called_once_with(model, parameters)
+                api_handler.prediction_manager.track_prediction.assert_called_once_with(mock_prediction)
                 
                 # Skip event publishing verification for now
                 # Event publishing verification is complex due to static method mocking
@@ -184,7 +198,7 @@ class TestAPIHandler:
         assert order is None
         assert "Database repositories not available" in error
     
-    def test_create_order_error_in_prediction(self, api_handler):
+    def test_create_order_error_in_prediction(self, api_handler, inline_thread_pool):
         """Test error handling when prediction creation fails."""
         # Mock order repository
         mock_order = MagicMock(spec=Order)
@@ -193,20 +207,31 @@ class TestAPIHandler:
         
         # Mock prediction_manager to raise exception
         api_handler.prediction_manager = MagicMock(spec=PredictionManager)
-        api_handler.prediction_manager.start_prediction.side_effect = Exception("API error")
+        api_handler.prediction_manager.create_prediction.side_effect = Exception("API error")
         
-        # Call create_order
-        order, error = api_handler.create_order("model-id", "prompt", {})
-        
-        # Verify error handling
-        assert order is None
-        assert "API error" in error
+        with patch("imagen_desktop.api.api_handler.OrderEventPublisher") as mock_order_publisher_class:
+            # Call create_order
+            order, error = api_handler.create_order("model-id", "prompt", {})
+            api_handler._writes.join()
+            
+            # The order is recorded, then failed once the prediction errors
+            assert order == mock_order
+            assert error is None
+            api_handler.order_repository.update_order_status.assert_called_once_with(
+                order_id=456,
+                status=OrderStatus.FAILED
+            )
+            failed_event = mock_order_publisher_class.publish_order_event.call_args[0][0]
+            assert failed_event.event_type == OrderEventType.FAILED
+            assert "API error" in failed_event.data.error
+            api_handler.prediction_manager.track_prediction.assert_not_called()
+            assert not api_handler._active_predictions
     
     def test_notify_generation_started(self, api_handler, mock_repositories):
         """Test notifying that generation has started."""
         # Set up active prediction
         prediction_id = "pred_notify"
-        api_handler._active_predictions.add(prediction_id)
+        api_handler._active_predictions[prediction_id] = None
         
         # Mock generation
         mock_generation = MagicMock(spec=Generation)
@@ -235,11 +260,11 @@ class TestAPIHandler:
         # Verify repository was not called
         assert not api_handler.generation_repository.get_generation.called
     
-    def test_handle_generation_completed(self, api_handler, mock_repositories):
+    def test_handle_generation_completed(self, api_handler, mock_repositories, inline_thread_pool):
         """Test handling completed generation."""
         # Set up active prediction
         prediction_id = "pred_completed"
-        api_handler._active_predictions.add(prediction_id)
+        api_handler._active_predictions[prediction_id] = None
         
         # Mock generation
         mock_generation = MagicMock(spec=Generation)
@@ -257,9 +282,14 @@ class TestAPIHandler:
         mock_order = MagicMock(spec=Order)
         mock_repositories["order"].get_order.return_value = mock_order
         
-        # Mock product creation
+        # Mock output saving and product creation
         mock_product = MagicMock(spec=Product)
-        api_handler._create_product_from_output = MagicMock(return_value=mock_product)
+        raw_outputs = ["http://example.com/image1.png", "http://example.com/image2.png"]
+        saved_rows = [{"file_path": Path("/tmp/image1.png")}, {"file_path": Path("/tmp/image2.png")}]
+        api_handler._save_output = MagicMock(
+            side_effect=lambda output, generation_id: saved_rows[raw_outputs.index(output)]
+        )
+        mock_repositories["product"].create_products.return_value = [mock_product, mock_product]
         
         # Mock event publishers
         with patch("imagen_desktop.api.api_handler.GenerationEventPublisher") as mock_gen_publisher_class:
@@ -267,9 +297,9 @@ class TestAPIHandler:
             with patch("imagen_desktop.api.api_handler.OrderEventPublisher") as mock_order_publisher_class:
                 mock_order_publisher_class.publish_order_event = MagicMock()
                 # Call _handle_generation_completed
-                raw_outputs = ["http://example.com/image1.png", "http://example.com/image2.png"]
                 api_handler._handle_generation_completed(prediction_id, raw_outputs)
-                
+                api_handler._writes.join()
+            
                 # Verify repository calls
                 mock_repositories["generation"].get_generation.assert_called_once_with(prediction_id)
                 mock_repositories["generation"].update_generation_status.assert_called_once_with(
@@ -284,23 +314,130 @@ class TestAPIHandler:
                     order_id=mock_generation.order_id,
                     status=OrderStatus.FULFILLED
                 )
-                
-                # Verify product creation calls
-                assert api_handler._create_product_from_output.call_count == 2
-                api_handler._create_product_from_output.assert_has_calls([
+            
+                # Verify outputs were saved, concurrently, and inserted together
+                assert api_handler._save_output.call_count == 2
+                api_handler._save_output.assert_has_calls([
                     call(raw_outputs[0], prediction_id),
                     call(raw_outputs[1], prediction_id)
-                ])
-                
+                ], any_order=True)
+                mock_repositories["product"].create_products.assert_called_once_with(saved_rows)
+                mock_repositories["product"].create_product.assert_not_called()
+            
                 # Skip event publishing verification for now
                 # Event publishing verification is complex due to static method mocking
                 # and would require more sophisticated test setup
                 # Skip event content verification
                 # Just verify that the repositories were accessed correctly
-                
+            
                 # Verify prediction was removed from active predictions
                 assert prediction_id not in api_handler._active_predictions
-    
+
+    def test_handle_generation_failed_uses_cached_generation(self, api_handler, mock_repositories):
+        """Test that generations created by this handler are not queried again."""
+        prediction_id = "pred_cached"
+        mock_generation = MagicMock(spec=Generation)
+        mock_generation.order_id = 789
+        api_handler._active_predictions[prediction_id] = mock_generation
+
+        with patch("imagen_desktop.api.api_handler.GenerationEventPublisher"), \
+                patch("imagen_desktop.api.api_handler.OrderEventPublisher"):
+            api_handler._handle_generation_failed(prediction_id, "boom")
+
+        mock_repositories["generation"].get_generation.assert_not_called()
+        assert prediction_id not in api_handler._active_predictions
+
+    def test_get_generation_queries_repository_once(self, api_handler, mock_repositories):
+        """Test that a generation looked up for an active prediction is kept."""
+        prediction_id = "pred_lookup"
+        mock_generation = MagicMock(spec=Generation)
+        mock_repositories["generation"].get_generation.return_value = mock_generation
+        api_handler._active_predictions[prediction_id] = None
+
+        assert api_handler._get_generation(prediction_id) is mock_generation
+        assert api_handler._get_generation(prediction_id) is mock_generation
+
+        mock_repositories["generation"].get_generation.assert_called_once_with(prediction_id)
+
+    def test_save_output_streams_download_to_disk(self, api_handler, tmp_path):
+        """Test that outputs are written chunk by chunk as they download."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"first", b"second"]
+
+        with patch.object(api_handler._http, "get", return_value=response) as mock_get, \
+                patch("imagen_desktop.api.api_handler.probe_image") as mock_probe:
+            mock_probe.return_value = MagicMock(width=64, height=32, format="PNG")
+            row = api_handler._save_output("http://example.com/image.png", "pred_stream")
+
+        mock_get.assert_called_once_with(
+            "http://example.com/image.png", stream=True, timeout=APIHandler.DOWNLOAD_TIMEOUT
+        )
+        assert row['file_path'].read_bytes() == b"firstsecond"
+        assert (row['width'], row['height']) == (64, 32)
+
+    def test_http_session_pools_and_retries(self, api_handler):
+        """Test that the download session keeps a connection per worker and retries."""
+        adapter = api_handler._http.get_adapter("https://replicate.delivery/image.png")
+
+        assert adapter._pool_maxsize == APIHandler.MAX_PARALLEL_DOWNLOADS
+        assert adapter.max_retries.total == APIHandler.DOWNLOAD_RETRIES
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_save_output_reads_png_size_from_download(self, api_handler, tmp_path):
+        """Test that PNG dimensions come from the downloaded bytes, not the file."""
+        png_head = (
+            b"\x89PNG\r\n\x1a\n" + (13).to_bytes(4, "big") + b"IHDR"
+            + (640).to_bytes(4, "big") + (480).to_bytes(4, "big")
+        )
+        response = MagicMock()
+        response.__enter__.return_value = response
+        # Split the header across chunks
+        response.iter_content.return_value = [png_head[:10], png_head[10:] + b"rest"]
+
+        with patch.object(api_handler._http, "get", return_value=response), \
+                patch("imagen_desktop.api.api_handler.probe_image") as mock_probe:
+            row = api_handler._save_output("http://example.com/image.png", "pred_png")
+
+        mock_probe.assert_not_called()
+        assert (row['width'], row['height'], row['format']) == (640, 480, "png")
+
+    def test_save_output_removes_partial_download(self, api_handler, tmp_path):
+        """Test that a download failing midway leaves no file behind."""
+        def broken_stream(chunk_size):
+            yield b"partial"
+            raise IOError("connection reset")
+
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.side_effect = broken_stream
+
+        with patch.object(api_handler._http, "get", return_value=response):
+            row = api_handler._save_output("http://example.com/image.png", "pred_broken")
+
+        assert row is None
+        assert not any(tmp_path.iterdir())
+
+    def test_save_output_renames_finished_download_into_place(self, api_handler, tmp_path):
+        """Test that only the finished file appears under its final name."""
+        def stream(chunk_size):
+            yield b"first"
+            # Mid-download, nothing exists under a .png name yet
+            assert not list(tmp_path.glob("*.png"))
+            yield b"second"
+
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.side_effect = stream
+
+        with patch.object(api_handler._http, "get", return_value=response), \
+                patch("imagen_desktop.api.api_handler.probe_image") as mock_probe:
+            mock_probe.return_value = MagicMock(width=64, height=32, format="PNG")
+            row = api_handler._save_output("http://example.com/image.png", "pred_atomic")
+
+        assert row['file_path'].suffix == ".png"
+        assert list(tmp_path.iterdir()) == [row['file_path']]
+
     def test_handle_generation_completed_unknown_prediction(self, api_handler):
         """Test handling completed generation for unknown prediction."""
         # Call with unknown prediction ID
@@ -309,65 +446,11 @@ class TestAPIHandler:
         # Verify repository was not called
         assert not api_handler.generation_repository.get_generation.called
     
-    def test_create_product_from_output(self, api_handler, mock_repositories):
-        """Test creating product from generation output."""
-        # Mock product repository
-        mock_product = MagicMock(spec=Product)
-        mock_repositories["product"].create_product.return_value = mock_product
-        
-        # Mock output
-        mock_output_url = "http://example.com/image.png"
-        
-        # Mock requests and file operations
-        with patch("requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.content = b"image data"
-            mock_get.return_value = mock_response
-            
-            with patch("builtins.open", create=True) as mock_open:
-                with patch("uuid.uuid4") as mock_uuid:
-                    mock_uuid.return_value = "test-uuid"
-                    
-                    with patch("PIL.Image.open") as mock_pil_open:
-                        mock_img = MagicMock()
-                        mock_img.size = (800, 600)
-                        mock_img.format = "PNG"
-                        mock_pil_open.return_value.__enter__.return_value = mock_img
-                        
-                        # Call _create_product_from_output
-                        generation_id = "pred_product"
-                        product = api_handler._create_product_from_output(mock_output_url, generation_id)
-                        
-                        # Verify results
-                        assert product == mock_product
-                        
-                        # Verify requests call
-                        mock_get.assert_called_once_with(mock_output_url)
-                        
-                        # Verify file operations
-                        output_path = Path.home() / '.imagen-desktop' / 'products' / 'test-uuid.png'
-                        mock_open.assert_called_once()
-                        file_handle = mock_open.return_value.__enter__.return_value
-                        file_handle.write.assert_called_once_with(b"image data")
-                        
-                        # Verify PIL operations
-                        mock_pil_open.assert_called_once()
-                        
-                        # Verify repository call
-                        mock_repositories["product"].create_product.assert_called_once_with(
-                            file_path=output_path,
-                            generation_id=generation_id,
-                            width=800,
-                            height=600,
-                            format="png",
-                            product_type=ProductType.IMAGE
-                        )
-    
     def test_handle_generation_failed(self, api_handler, mock_repositories):
         """Test handling failed generation."""
         # Set up active prediction
         prediction_id = "pred_failed"
-        api_handler._active_predictions.add(prediction_id)
+        api_handler._active_predictions[prediction_id] = None
         
         # Mock generation
         mock_generation = MagicMock(spec=Generation)
@@ -386,6 +469,7 @@ class TestAPIHandler:
                 # Call _handle_generation_failed
                 error_message = "API processing error"
                 api_handler._handle_generation_failed(prediction_id, error_message)
+                api_handler._writes.join()
                 
                 # Verify repository calls
                 mock_repositories["generation"].get_generation.assert_called_once_with(prediction_id)
@@ -411,7 +495,7 @@ class TestAPIHandler:
         """Test handling canceled generation."""
         # Set up active prediction
         prediction_id = "pred_canceled"
-        api_handler._active_predictions.add(prediction_id)
+        api_handler._active_predictions[prediction_id] = None
         
         # Mock generation
         mock_generation = MagicMock(spec=Generation)
@@ -429,6 +513,7 @@ class TestAPIHandler:
                 mock_order_publisher_class.publish_order_event = MagicMock()
                 # Call _handle_generation_canceled
                 api_handler._handle_generation_canceled(prediction_id)
+                api_handler._writes.join()
                 
                 # Verify repository calls
                 mock_repositories["generation"].get_generation.assert_called_once_with(prediction_id)
@@ -453,7 +538,7 @@ class TestAPIHandler:
         """Test cancelling a generation."""
         # Set up active prediction
         prediction_id = "pred_to_cancel"
-        api_handler._active_predictions.add(prediction_id)
+        api_handler._active_predictions[prediction_id] = None
         
         # Mock prediction_manager
         api_handler.prediction_manager = MagicMock(spec=PredictionManager)
@@ -479,7 +564,7 @@ class TestAPIHandler:
         """Test error handling when cancelling a generation."""
         # Set up active prediction
         prediction_id = "pred_cancel_error"
-        api_handler._active_predictions.add(prediction_id)
+        api_handler._active_predictions[prediction_id] = None
         
         # Mock prediction_manager to raise exception
         api_handler.prediction_manager = MagicMock(spec=PredictionManager)
@@ -185,6 +185,32 @@ class TestPredictionManager:
         # Verify prediction was removed from active predictions
         assert prediction_id not in prediction_manager._active_predictions
     
+    def test_poll_prediction_reports_progress(self, prediction_manager, mock_client):
+        """Test that progress parsed from logs is emitted once per change."""
+        prediction_id = "pred_progress"
+        prediction_manager._active_predictions[prediction_id] = {'thread': None, 'prediction': None}
+        
+        progress_spy = MagicMock()
+        prediction_manager.generation_progress.connect(progress_spy)
+        
+        def processing(percentage):
+            prediction = MagicMock()
+            prediction.status = "processing"
+            prediction.progress.percentage = percentage
+            return prediction
+        
+        mock_succeeded = MagicMock()
+        mock_succeeded.status = "succeeded"
+        mock_succeeded.output = []
+        mock_client.get_prediction.side_effect = [
+            processing(0.25), processing(0.25), processing(0.5), mock_succeeded
+        ]
+        
+        with patch("imagen_desktop.api.prediction_manager.time.sleep"):
+            prediction_manager._poll_prediction(prediction_id)
+        
+        assert progress_spy.call_args_list == [call(prediction_id, 25), call(prediction_id, 50)]
+    
     def test_poll_prediction_failed(self, prediction_manager, mock_client):
         """Test polling for a failed prediction."""
         # Mock prediction
@@ -0,0 +1,54 @@
+"""Tests for GenerationRepository class."""
+import pytest
+from unittest.mock import Mock, MagicMock
+
+from imagen_desktop.data.repositories.generation_repository import GenerationRepository
+from imagen_desktop.core.models.generation import GenerationStatus
+
+
+class TestGenerationRepository:
+    """Test suite for GenerationRepository class."""
+
+    @pytest.fixture
+    def mock_db_session(self):
+        """Create a mock database session."""
+        mock_session = MagicMock()
+
+        # Make the session context manager return the session itself
+        mock_session.__enter__.return_value = mock_session
+        mock_session.__exit__.return_value = None
+
+        return mock_session
+
+    @pytest.fixture
+    def repository(self, mock_db_session):
+        """Create a GenerationRepository with a mock database."""
+        mock_db = Mock()
+        mock_db.get_session.return_value = mock_db_session
+        return GenerationRepository(mock_db)
+
+    def test_update_generation_status_single_statement(self, repository, mock_db_session):
+        """Test that a status update is one UPDATE without loading the row."""
+        mock_db_session.execute.return_value.rowcount = 1
+
+        result = repository.update_generation_status(
+            "pred_123", GenerationStatus.FAILED, error="boom"
+        )
+
+        assert result is True
+        mock_db_session.query.assert_not_called()
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.commit.assert_called_once()
+
+        statement = mock_db_session.execute.call_args[0][0]
+        params = statement.compile().params
+        assert params['status'] == GenerationStatus.FAILED.value
+        assert params['error'] == "boom"
+
+    def test_update_generation_status_missing_generation(self, repository, mock_db_session):
+        """Test that updating an unknown generation reports failure."""
+        mock_db_session.execute.return_value.rowcount = 0
+
+        result = repository.update_generation_status("missing", GenerationStatus.COMPLETED)
+
+        assert result is False
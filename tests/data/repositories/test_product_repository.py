@@ -191,6 +191,52 @@ class TestProductRepository:
         # Check the returned product
         assert product is None
     
+    @patch("imagen_desktop.data.repositories.product_repository.ProductEventPublisher")
+    def test_create_products_success(self, mock_publisher, repository, mock_db, tmp_path):
+        """Test create_products inserts all rows in one transaction."""
+        _, mock_session = mock_db
+        
+        first = tmp_path / "first.png"
+        second = tmp_path / "second.png"
+        first.write_bytes(b"x" * 10)
+        second.write_bytes(b"x" * 20)
+        
+        # Assign IDs as a flush would
+        def session_add_all_side_effect(models):
+            for index, model in enumerate(models, start=1):
+                model.id = index
+        
+        mock_session.add_all.side_effect = session_add_all_side_effect
+        
+        with patch("imagen_desktop.data.repositories.product_repository.logger"):
+            products = repository.create_products([
+                {"file_path": first, "generation_id": "gen-123", "width": 512, "height": 512, "format": "png"},
+                {"file_path": second, "generation_id": "gen-123", "width": 256, "height": 256, "format": "png"}
+            ])
+        
+        # Verify a single batched insert and commit
+        mock_session.add_all.assert_called_once()
+        mock_session.add.assert_not_called()
+        mock_session.commit.assert_called_once()
+        
+        assert [p.id for p in products] == [1, 2]
+        assert [p.file_size for p in products] == [10, 20]
+        assert all(p.product_type == ProductType.IMAGE for p in products)
+        assert mock_publisher.publish_product_event.call_count == 2
+    
+    def test_create_products_skips_missing_files(self, repository, mock_db, tmp_path):
+        """Test create_products ignores rows whose file is missing."""
+        _, mock_session = mock_db
+        
+        with patch("imagen_desktop.data.repositories.product_repository.logger") as mock_logger:
+            products = repository.create_products([{"file_path": tmp_path / "missing.png"}])
+            
+            mock_logger.error.assert_called_once()
+            assert "File not found" in mock_logger.error.call_args[0][0]
+        
+        mock_session.add_all.assert_not_called()
+        assert products == []
+    
     def test_get_product_success(self, repository, sample_product_model):
         """Test get_product with successful retrieval."""
         # Configure the repository to return the sample model
@@ -231,6 +277,42 @@ class TestProductRepository:
         # Check the returned product
         assert product is None
     
+    def test_list_products_maps_rows(self, repository, mock_db, sample_product_model):
+        """Test list_products maps selected rows straight to domain objects."""
+        _, mock_session = mock_db
+        mock_session.execute.return_value.all.return_value = [sample_product_model]
+        
+        products = repository.list_products(product_type=ProductType.IMAGE, limit=5)
+        
+        mock_session.execute.assert_called_once()
+        mock_session.query.assert_not_called()
+        assert len(products) == 1
+        assert products[0].id == 42
+        assert products[0].file_path == Path("/tmp/test.png")
+    
+    def test_list_products_breaks_ties_by_id(self, repository, mock_db):
+        """Test list_products orders rows sharing a sort value by id."""
+        _, mock_session = mock_db
+        mock_session.execute.return_value.all.return_value = []
+        
+        repository.list_products()
+        repository.list_products(descending=False)
+        
+        newest, oldest = [
+            str(c.args[0]).split("ORDER BY")[1] for c in mock_session.execute.call_args_list
+        ]
+        assert newest.split() == ["products.created_at", "DESC,", "products.id", "DESC"]
+        assert oldest.split() == ["products.created_at,", "products.id"]
+    
+    def test_list_products_unknown_sort_column(self, repository):
+        """Test list_products with an unsupported sort column."""
+        with patch("imagen_desktop.data.repositories.product_repository.logger") as mock_logger:
+            products = repository.list_products(order_by="name")
+            
+            mock_logger.error.assert_called_once()
+        
+        assert products == []
+    
     def test_get_all_products_success(self, repository, mock_db, sample_product_model):
         """Test get_all_products with successful retrieval."""
         _, mock_session = mock_db
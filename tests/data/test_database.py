@@ -54,6 +54,27 @@ class TestDatabaseInitialization(unittest.TestCase):
         
         # Check for alembic version table
         self.assertIn('alembic_version', tables)
+    
+    def test_connections_use_wal(self):
+        """Test that connections are configured for concurrent access."""
+        database = initialize_database(self.db_path)
+        
+        with database.engine.connect() as connection:
+            journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+            synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+        
+        self.assertEqual(journal_mode, 'wal')
+        self.assertEqual(synchronous, 1)  # NORMAL
+    
+    def test_close_releases_connections(self):
+        """Test that closing the database empties the connection pool."""
+        database = initialize_database(self.db_path)
+        self.assertTrue(database.check_database_health())
+        self.assertGreater(database.engine.pool.checkedin(), 0)
+        
+        database.close()
+        
+        self.assertEqual(database.engine.pool.checkedin(), 0)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""Tests for the background database write queue."""
+import threading
+from unittest.mock import MagicMock
+
+from imagen_desktop.data.write_queue import WriteQueue
+
+
+class TestWriteQueue:
+    """Test suite for WriteQueue."""
+    
+    def test_writes_apply_in_order(self):
+        """Test that queued writes run in submission order."""
+        writes = WriteQueue()
+        applied = []
+        
+        for index in range(5):
+            writes.submit(applied.append, index)
+        writes.join()
+        
+        assert applied == [0, 1, 2, 3, 4]
+        writes.close()
+    
+    def test_writes_run_off_caller_thread(self):
+        """Test that writes are applied on the writer thread."""
+        writes = WriteQueue()
+        threads = []
+        
+        writes.submit(lambda: threads.append(threading.current_thread()))
+        writes.join()
+        
+        assert threads and threads[0] is not threading.current_thread()
+        writes.close()
+    
+    def test_failed_write_does_not_stop_queue(self):
+        """Test that an exception in one write doesn't block later ones."""
+        writes = WriteQueue()
+        later = MagicMock()
+        
+        writes.submit(MagicMock(side_effect=RuntimeError("locked")))
+        writes.submit(later, order_id=1)
+        writes.join()
+        
+        later.assert_called_once_with(order_id=1)
+        writes.close()
+    
+    def test_close_applies_outstanding_writes(self):
+        """Test that closing waits for queued writes."""
+        writes = WriteQueue()
+        write = MagicMock()
+        
+        writes.submit(write)
+        writes.close()
+        
+        write.assert_called_once_with()
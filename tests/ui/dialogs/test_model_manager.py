@@ -0,0 +1,157 @@
+"""Tests for the ModelManager dialog."""
+import os
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from PyQt6.QtCore import Qt
+
+from imagen_desktop.utils import model_cache
+from imagen_desktop.utils.model_cache import MODEL_CACHE_TTL, save_cached_models
+from imagen_desktop.ui.dialogs.model_manager import ModelManager
+from imagen_desktop.ui.dialogs.model_manager_presenter import MODEL_COLLECTION, ModelLoaderThread
+
+
+def _listed_model(identifier):
+    """Create a model dict as fetched from the collection."""
+    owner, name = identifier.split("/")
+    return {
+        'name': name,
+        'owner': owner,
+        'identifier': identifier,
+        'description': '',
+        'version': None,
+        'featured': False
+    }
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the model cache at a temporary directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(model_cache, "MODEL_CACHE_DIR", directory)
+    return directory
+
+
+@pytest.fixture
+def model_repository():
+    """Create a repository holding one installed model."""
+    installed = MagicMock(
+        identifier="me/private-model",
+        owner="me",
+        description="",
+        model_metadata={}
+    )
+    # name is a Mock constructor argument, so it is set afterwards
+    installed.name = "private-model"
+    repository = MagicMock()
+    repository.list_models.return_value = [installed]
+    return repository
+
+
+@pytest.fixture
+def loader_start(mocker):
+    """Keep the model loader from fetching."""
+    return mocker.patch.object(ModelLoaderThread, "start", autospec=True)
+
+
+def _save_stale_listing(cache_dir, models):
+    """Cache a listing and age it past the TTL."""
+    save_cached_models(MODEL_COLLECTION, models)
+    old = time.time() - MODEL_CACHE_TTL - 60
+    os.utime(cache_dir / f"models-{MODEL_COLLECTION}.json", (old, old))
+
+
+def _identifiers(dialog):
+    """Get the identifiers of the models listed in the dialog."""
+    return [
+        dialog.tree.topLevelItem(i).data(0, Qt.ItemDataRole.UserRole)['identifier']
+        for i in range(dialog.tree.topLevelItemCount())
+    ]
+
+
+@pytest.mark.ui
+class TestModelManager:
+    """Test suite for ModelManager."""
+
+    def test_opens_on_installed_models_despite_cache(self, qtbot, model_repository, loader_start):
+        """Test that a cached collection doesn't replace the installed models."""
+        save_cached_models(MODEL_COLLECTION, [_listed_model("acme/sdxl")])
+
+        dialog = ModelManager(MagicMock(), model_repository)
+        qtbot.addWidget(dialog)
+
+        assert _identifiers(dialog) == ["me/private-model"]
+
+    def test_refresh_shows_cached_listing_while_fetching(self, qtbot, model_repository, loader_start):
+        """Test that refreshing shows the cached collection before the fetch returns."""
+        save_cached_models(MODEL_COLLECTION, [_listed_model("acme/sdxl")])
+        dialog = ModelManager(MagicMock(), model_repository)
+        qtbot.addWidget(dialog)
+        loader_start.reset_mock()
+
+        dialog.refresh_button.click()
+
+        assert _identifiers(dialog) == ["acme/sdxl"]
+        loader_start.assert_called_once()
+
+    def test_open_without_cache_does_not_fetch(self, qtbot, model_repository, loader_start):
+        """Test that a missing cache is left for an explicit refresh."""
+        dialog = ModelManager(MagicMock(), model_repository)
+        qtbot.addWidget(dialog)
+
+        loader_start.assert_not_called()
+
+    def test_stale_cache_revalidates_without_replacing_view(
+            self, qtbot, model_repository, loader_start, cache_dir):
+        """Test that a background revalidation leaves the installed models shown."""
+        _save_stale_listing(cache_dir, [_listed_model("acme/sdxl")])
+
+        dialog = ModelManager(MagicMock(), model_repository)
+        qtbot.addWidget(dialog)
+        loader_start.assert_called_once_with(dialog.presenter.revalidation_thread)
+
+        dialog.presenter.revalidation_thread.models_loaded.emit([_listed_model("acme/flux")])
+
+        assert _identifiers(dialog) == ["me/private-model"]
+
+    def test_background_revalidation_error_is_not_modal(
+            self, qtbot, model_repository, loader_start, cache_dir, mocker):
+        """Test that a failed background revalidation doesn't open a dialog."""
+        _save_stale_listing(cache_dir, [_listed_model("acme/sdxl")])
+        critical = mocker.patch("imagen_desktop.ui.dialogs.model_manager.QMessageBox.critical")
+
+        dialog = ModelManager(MagicMock(), model_repository)
+        qtbot.addWidget(dialog)
+        dialog.presenter.revalidation_thread.error_occurred.emit("offline")
+
+        critical.assert_not_called()
+        assert _identifiers(dialog) == ["me/private-model"]
+
+    def test_refresh_during_revalidation_shows_its_result(
+            self, qtbot, model_repository, loader_start, cache_dir):
+        """Test that a refresh clicked while revalidating still updates the view."""
+        _save_stale_listing(cache_dir, [_listed_model("acme/sdxl")])
+        dialog = ModelManager(MagicMock(), model_repository)
+        qtbot.addWidget(dialog)
+
+        dialog.refresh_button.click()
+        loader_start.assert_called_with(dialog.presenter.loader_thread)
+        dialog.presenter.loader_thread.models_loaded.emit([_listed_model("acme/flux")])
+
+        assert _identifiers(dialog) == ["acme/flux"]
+        assert dialog.refresh_button.isEnabled()
+
+    def test_revalidation_replaces_shown_cached_listing(
+            self, qtbot, model_repository, loader_start, cache_dir):
+        """Test that a newer revalidated listing replaces the stale one on screen."""
+        _save_stale_listing(cache_dir, [_listed_model("acme/sdxl")])
+        dialog = ModelManager(MagicMock(), model_repository)
+        qtbot.addWidget(dialog)
+        dialog.refresh_button.click()
+        assert _identifiers(dialog) == ["acme/sdxl"]
+
+        dialog.presenter.revalidation_thread.models_loaded.emit([_listed_model("acme/flux")])
+
+        assert _identifiers(dialog) == ["acme/flux"]
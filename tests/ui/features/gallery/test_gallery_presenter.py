@@ -0,0 +1,118 @@
+"""Tests for the GalleryPresenter class."""
+import pytest
+from unittest.mock import MagicMock
+from pathlib import Path
+from datetime import datetime
+
+from imagen_desktop.core.models.product import Product, ProductType
+from imagen_desktop.ui.features.gallery.gallery_presenter import GalleryPresenter
+
+
+@pytest.fixture
+def sample_products():
+    """Create sample products for testing."""
+    return [
+        Product(
+            id=index,
+            file_path=Path(f"/tmp/product{index}.png"),
+            product_type=ProductType.IMAGE,
+            generation_id=f"gen{index}",
+            created_at=datetime(2025, 5, 17, 12, index, 0),
+            file_size=index * 1024
+        )
+        for index in range(1, 4)
+    ]
+
+
+@pytest.fixture
+def mock_repository(sample_products):
+    """Create a mock product repository."""
+    repository = MagicMock()
+    repository.list_products.return_value = list(sample_products)
+    repository.delete_product.return_value = True
+    return repository
+
+
+@pytest.fixture
+def presenter(mock_repository):
+    """Create a GalleryPresenter with a mock repository."""
+    return GalleryPresenter(product_repository=mock_repository)
+
+
+class TestGalleryPresenter:
+    """Test suite for GalleryPresenter."""
+
+    def test_get_product_details_uses_listed_products(self, presenter, mock_repository):
+        """Test that details of listed products need no repository query."""
+        presenter.list_products()
+
+        details = presenter.get_product_details(2)
+
+        assert details['size'] == 2 * 1024
+        mock_repository.get_product.assert_not_called()
+
+    def test_delete_product_forgets_listed_product(self, presenter, mock_repository, sample_products):
+        """Test that deleted products are dropped from the lookups."""
+        presenter.list_products()
+        mock_repository.get_product.return_value = None
+
+        assert presenter.delete_product(1)
+
+        mock_repository.delete_product.assert_called_once_with(1)
+        assert presenter.get_product_details(1) == {}
+
+    def test_delete_product_drops_cached_thumbnail(self, presenter, mock_repository, mocker):
+        """Test that the deleted product's disk thumbnail is removed."""
+        presenter.list_products()
+        remove = mocker.patch(
+            "imagen_desktop.ui.features.gallery.gallery_presenter.remove_cached_thumbnail"
+        )
+
+        presenter.delete_product(1)
+
+        remove.assert_called_once_with(Path("/tmp/product1.png"))
+
+    def test_list_products_reuses_recent_listing(self, presenter, mock_repository):
+        """Test that repeated listings within the TTL skip the repository."""
+        first = presenter.list_products(sort_by="Oldest First")
+        second = presenter.list_products(sort_by="Oldest First")
+
+        assert first == second
+        mock_repository.list_products.assert_called_once()
+
+    def test_list_products_cache_keyed_by_query(self, presenter, mock_repository):
+        """Test that different sort orders are cached separately."""
+        presenter.list_products(sort_by="Most Recent")
+        presenter.list_products(sort_by="Largest Files")
+
+        assert mock_repository.list_products.call_count == 2
+
+    def test_list_products_cache_expires(self, presenter, mock_repository, mocker):
+        """Test that listings are queried again after the TTL."""
+        mock_time = mocker.patch("imagen_desktop.ui.features.gallery.gallery_presenter.time")
+        mock_time.monotonic.return_value = 100.0
+        presenter.list_products()
+
+        mock_time.monotonic.return_value = 100.0 + GalleryPresenter.LIST_CACHE_TTL
+        presenter.list_products()
+
+        assert mock_repository.list_products.call_count == 2
+
+    def test_delete_product_invalidates_listing_cache(self, presenter, mock_repository):
+        """Test that deleting a product forces the next listing to query."""
+        presenter.list_products()
+        presenter.delete_product(1)
+        presenter.list_products()
+
+        assert mock_repository.list_products.call_count == 2
+
+    def test_list_products_maps_sort_option_to_query(self, presenter, mock_repository):
+        """Test that sorting and limits are passed to the repository query."""
+        presenter.list_products(limit=10, sort_by="Smallest Files")
+
+        mock_repository.list_products.assert_called_once_with(
+            product_type=ProductType.IMAGE,
+            order_by='file_size',
+            descending=False,
+            limit=10
+        )
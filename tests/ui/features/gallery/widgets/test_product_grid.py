@@ -0,0 +1,261 @@
+"""Tests for the ProductGrid widget."""
+import pytest
+from datetime import datetime
+
+from PIL import Image
+
+from imagen_desktop.core.events.product_events import (
+    ProductEvent, ProductEventPublisher, ProductEventType
+)
+from imagen_desktop.core.models.product import Product, ProductType
+from imagen_desktop.ui.features.gallery.widgets.product_grid import ProductGrid
+
+
+@pytest.fixture
+def make_products(tmp_path):
+    """Create products backed by real image files."""
+    def _make_products(ids):
+        products = []
+        for product_id in ids:
+            path = tmp_path / f"product{product_id}.png"
+            if not path.exists():
+                Image.new("RGB", (32, 32)).save(path, "PNG")
+            products.append(Product(
+                id=product_id,
+                file_path=path,
+                product_type=ProductType.IMAGE,
+                generation_id=f"gen{product_id}",
+                created_at=datetime(2025, 5, 17, 12, 0, 0)
+            ))
+        return products
+    return _make_products
+
+
+@pytest.mark.ui
+class TestProductGrid:
+    """Test suite for ProductGrid."""
+
+    def test_set_products_reuses_existing_thumbnails(self, qtbot, make_products):
+        """Test that refreshing keeps widgets for products still listed."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+
+        grid.set_products(make_products([1, 2, 3]))
+        before = {t.product.id: t for t in grid.thumbnails}
+
+        grid.set_products(make_products([4, 3, 1]))
+
+        assert [t.product.id for t in grid.thumbnails] == [4, 3, 1]
+        assert grid.thumbnails[1] is before[3]
+        assert grid.thumbnails[2] is before[1]
+
+    def test_set_products_unchanged_listing_skips_layout(self, qtbot, make_products, mocker):
+        """Test that refreshing with the same listing leaves the layout alone."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+        grid.set_products(make_products([1, 2, 3]))
+
+        layout = mocker.spy(grid, "_layout_thumbnails")
+        grid.set_products(make_products([1, 2, 3]), force=True)
+
+        layout.assert_not_called()
+
+    def test_set_products_unchanged_directory_skips_scan(self, qtbot, make_products, mocker):
+        """Test that an identical listing over unchanged folders is not rescanned."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+        products = make_products([1, 2, 3])
+        grid.set_products(products)
+
+        scan = mocker.patch(
+            "imagen_desktop.ui.shared.widgets.base_product_display.existing_paths"
+        )
+        grid.set_products(products)
+        scan.assert_not_called()
+
+        grid.set_products(products, force=True)
+        scan.assert_called_once()
+
+    def test_set_products_lays_out_in_order(self, qtbot, make_products):
+        """Test that thumbnails are placed row by row in listing order."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+
+        grid.set_products(make_products([1, 2, 3, 4]))
+        grid.set_products(make_products([4, 3, 2, 1]))
+
+        positions = [
+            grid.content_layout.getItemPosition(grid.content_layout.indexOf(t))[:2]
+            for t in grid.thumbnails
+        ]
+        assert positions == [(0, 0), (0, 1), (0, 2), (1, 0)]
+        assert (grid.current_row, grid.current_col) == (1, 1)
+
+    def test_only_visible_thumbnails_are_loaded(self, qtbot, make_products):
+        """Test that thumbnails below the viewport are not decoded until scrolled to."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+        grid.resize(700, 250)
+        grid.show()
+        qtbot.waitExposed(grid)
+
+        grid.set_products(make_products(range(1, 13)))
+        qtbot.waitUntil(lambda: grid.thumbnails[0].thumbnail_requested)
+        assert not grid.thumbnails[-1].thumbnail_requested
+
+        scroll_bar = grid.scroll.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+        qtbot.waitUntil(lambda: grid.thumbnails[-1].thumbnail_requested)
+
+    def test_new_thumbnails_are_shown_when_placed(self, qtbot, make_products):
+        """Test that thumbnails added to a visible grid are shown right away."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+        grid.show()
+        qtbot.waitExposed(grid)
+
+        grid.set_products(make_products([1, 2, 3]))
+        grid.add_product(make_products([4])[0])
+
+        assert all(t.isVisible() for t in grid.thumbnails)
+
+    def test_visibility_pass_visits_rows_near_viewport(self, qtbot, make_products):
+        """Test that a pass looks only at the rows crossing the viewport."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+        grid.resize(700, 250)
+        grid.show()
+        qtbot.waitExposed(grid)
+
+        grid.set_products(make_products(range(1, 61)))
+        qtbot.waitUntil(lambda: grid.thumbnails[0].thumbnail_requested)
+
+        visible = grid.scroll_content.visibleRegion().boundingRect()
+        start, end = grid._thumbnail_range(visible)
+        assert start == 0
+        assert end < len(grid.thumbnails)
+        assert all(not t.thumbnail_requested for t in grid.thumbnails[end + 3 * grid.max_cols:])
+
+    def test_scroll_steps_coalesce_into_one_pass(self, qtbot, make_products, mocker):
+        """Test that a burst of scroll steps runs a single visibility pass."""
+        load_visible = mocker.spy(ProductGrid, "_load_visible_thumbnails")
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+        grid.resize(700, 250)
+        grid.show()
+        qtbot.waitExposed(grid)
+        grid.set_products(make_products(range(1, 31)))
+        qtbot.waitUntil(lambda: grid.thumbnails[0].thumbnail_requested)
+        qtbot.wait(10)
+        load_visible.reset_mock()
+
+        scroll_bar = grid.scroll.verticalScrollBar()
+        for step in range(1, 11):
+            scroll_bar.setValue(step * 20)
+        qtbot.waitUntil(lambda: not grid._scroll_timer.isActive())
+
+        assert load_visible.call_count == 1
+
+    def test_remove_product_closes_gap(self, qtbot, make_products):
+        """Test that removing one product shifts the rest without rebuilding them."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+
+        grid.set_products(make_products([1, 2, 3, 4]))
+        kept = grid.thumbnails[1:]
+
+        assert grid.remove_product(1)
+        assert not grid.remove_product(1)
+
+        assert grid.thumbnails == kept
+        positions = [
+            grid.content_layout.getItemPosition(grid.content_layout.indexOf(t))[:2]
+            for t in grid.thumbnails
+        ]
+        assert positions == [(0, 0), (0, 1), (0, 2)]
+
+    def test_deleted_event_removes_thumbnail_once(self, qtbot, make_products, mocker):
+        """Test that a deletion event is handled by the grid's own subscription."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+        products = make_products([1, 2, 3])
+        grid.set_products(products)
+        remove = mocker.spy(grid, "remove_product")
+
+        try:
+            ProductEventPublisher.publish_product_event(
+                ProductEvent(ProductEventType.DELETED, products[0])
+            )
+        finally:
+            grid.close()
+
+        remove.assert_called_once_with(1)
+        assert [t.product.id for t in grid.thumbnails] == [2, 3]
+
+    def test_far_offscreen_thumbnails_are_released(self, qtbot, make_products):
+        """Test that thumbnails scrolled far out of view give up their pixmaps."""
+        grid = ProductGrid()
+        grid.RELEASE_VIEWPORTS = 0
+        qtbot.addWidget(grid)
+        grid.resize(700, 250)
+        grid.show()
+        qtbot.waitExposed(grid)
+
+        grid.set_products(make_products(range(1, 13)))
+        qtbot.waitUntil(lambda: grid.thumbnails[0].thumbnail_requested)
+
+        scroll_bar = grid.scroll.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+        qtbot.waitUntil(lambda: not grid.thumbnails[0].thumbnail_requested)
+
+    def test_layout_leaves_unmoved_thumbnails_in_place(self, qtbot, make_products, mocker):
+        """Test that only thumbnails changing cell are re-inserted."""
+        grid = ProductGrid()
+        qtbot.addWidget(grid)
+        grid.set_products(make_products([1, 2, 3, 4]))
+
+        add_widget = mocker.spy(grid.content_layout, "addWidget")
+        grid.set_products(make_products([1, 2, 3, 5]))
+
+        assert add_widget.call_count == 1
+
+    def test_large_listing_is_created_in_batches(self, qtbot, make_products):
+        """Test that thumbnails beyond one batch are created on later passes."""
+        grid = ProductGrid()
+        grid.RENDER_BATCH_SIZE = 4
+        qtbot.addWidget(grid)
+        products = make_products(range(1, 11))
+
+        grid.set_products(products)
+        assert [t.product.id for t in grid.thumbnails] == [1, 2, 3, 4]
+        first = grid.thumbnails[0]
+
+        qtbot.waitUntil(lambda: len(grid.thumbnails) == 10)
+        assert [t.product.id for t in grid.thumbnails] == list(range(1, 11))
+        assert grid.thumbnails[0] is first
+
+    def test_remove_product_during_batched_listing(self, qtbot, make_products):
+        """Test that removing a product mid-listing still creates the rest."""
+        grid = ProductGrid()
+        grid.RENDER_BATCH_SIZE = 4
+        qtbot.addWidget(grid)
+
+        grid.set_products(make_products(range(1, 11)))
+        assert grid.remove_product(2)
+        assert grid.remove_product(8)
+
+        qtbot.waitUntil(lambda: len(grid.thumbnails) == 8)
+        assert [t.product.id for t in grid.thumbnails] == [1, 3, 4, 5, 6, 7, 9, 10]
+
+    def test_add_product_during_batched_listing(self, qtbot, make_products):
+        """Test that a product added mid-listing keeps its widget and place."""
+        grid = ProductGrid()
+        grid.RENDER_BATCH_SIZE = 4
+        qtbot.addWidget(grid)
+
+        grid.set_products(make_products(range(1, 11)))
+        grid.add_product(make_products([11])[0])
+
+        assert [t.product.id for t in grid.thumbnails] == list(range(1, 12))
+        qtbot.wait(50)
+        assert [t.product.id for t in grid.thumbnails] == list(range(1, 12))
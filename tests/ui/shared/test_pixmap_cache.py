@@ -0,0 +1,58 @@
+"""Tests for the shared pixmap cache."""
+
+import pytest
+from PyQt6.QtGui import QImage, QColor
+
+from imagen_desktop.ui.shared.pixmap_cache import PixmapCache
+
+
+def _write_image(path, width=10, height=10):
+    """Write a solid-colour PNG to disk."""
+    image = QImage(width, height, QImage.Format.Format_ARGB32)
+    image.fill(QColor("red"))
+    assert image.save(str(path), "PNG")
+    return path
+
+
+@pytest.mark.ui
+class TestPixmapCache:
+    """Tests for PixmapCache."""
+
+    def test_get_returns_cached_pixmap(self, qapp, tmp_path):
+        """Test that repeated lookups reuse the decoded pixmap."""
+        path = _write_image(tmp_path / "image.png")
+        cache = PixmapCache()
+
+        first = cache.get(path)
+        second = cache.get(path)
+
+        assert not first.isNull()
+        assert first.cacheKey() == second.cacheKey()
+
+    def test_get_missing_file_returns_null_pixmap(self, qapp, tmp_path):
+        """Test that a missing file yields a null pixmap."""
+        cache = PixmapCache()
+        assert cache.get(tmp_path / "missing.png").isNull()
+
+    def test_invalidate_forces_reload(self, qapp, tmp_path):
+        """Test that invalidated entries are decoded again."""
+        path = _write_image(tmp_path / "image.png")
+        cache = PixmapCache()
+
+        first = cache.get(path)
+        cache.invalidate(path)
+        second = cache.get(path)
+
+        assert first.cacheKey() != second.cacheKey()
+
+    def test_evicts_least_recently_used(self, qapp, tmp_path):
+        """Test that the byte budget evicts the oldest entry."""
+        first_path = _write_image(tmp_path / "first.png")
+        second_path = _write_image(tmp_path / "second.png")
+        probe = PixmapCache().get(first_path)
+        cache = PixmapCache(max_bytes=PixmapCache._estimate_size(probe))
+
+        first = cache.get(first_path)
+        cache.get(second_path)
+
+        assert cache.get(first_path).cacheKey() != first.cacheKey()
@@ -0,0 +1,254 @@
+"""Tests for thumbnail decoding."""
+
+import os
+
+import pytest
+from PIL import Image
+
+from imagen_desktop.ui.shared import thumbnails
+from imagen_desktop.ui.shared.thumbnails import (
+    THUMBNAIL_SIZE, ThumbnailLoader, load_thumbnail_image, prune_thumbnail_cache,
+    remove_cached_thumbnail, thumbnail_cache_paths, thumbnail_pixmap_key
+)
+
+
+@pytest.fixture(autouse=True)
+def thumbnail_cache_dir(tmp_path, monkeypatch):
+    """Point the thumbnail cache at a temporary directory."""
+    cache_dir = tmp_path / "thumbnail-cache"
+    monkeypatch.setattr(thumbnails, "THUMBNAIL_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(thumbnails, "_cache_bytes", None)
+    return cache_dir
+
+
+def _write_entry(cache_dir, name, nbytes, mtime):
+    """Create a cache entry of a given size and modification time."""
+    cache_dir.mkdir(exist_ok=True)
+    entry = cache_dir / name
+    entry.write_bytes(b"x" * nbytes)
+    os.utime(entry, (mtime, mtime))
+    return entry
+
+
+@pytest.mark.ui
+class TestLoadThumbnailImage:
+    """Tests for load_thumbnail_image."""
+
+    def test_downscales_preserving_aspect_ratio(self, qapp, tmp_path):
+        """Test that large images are reduced to fit the thumbnail box."""
+        path = tmp_path / "large.jpg"
+        Image.new("RGB", (1600, 800), "blue").save(path, "JPEG")
+
+        image = load_thumbnail_image(path)
+
+        assert image.width() == THUMBNAIL_SIZE
+        assert image.height() == THUMBNAIL_SIZE // 2
+
+    def test_small_images_are_not_enlarged(self, qapp, tmp_path):
+        """Test that images smaller than the box keep their size."""
+        path = tmp_path / "small.png"
+        Image.new("RGBA", (50, 40)).save(path, "PNG")
+
+        image = load_thumbnail_image(path)
+
+        assert (image.width(), image.height()) == (50, 40)
+
+    def test_invalid_file_returns_null_image(self, qapp, tmp_path):
+        """Test that unreadable files produce a null image."""
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"not an image")
+
+        assert load_thumbnail_image(path).isNull()
+
+    def test_thumbnail_written_to_disk_cache(self, qapp, tmp_path):
+        """Test that generated thumbnails are saved for reuse."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+
+        load_thumbnail_image(path)
+
+        assert thumbnail_cache_paths(path)[0].exists()
+
+    def test_opaque_thumbnail_cached_as_jpeg(self, qapp, tmp_path):
+        """Test that thumbnails without transparency are stored as JPEG."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+
+        load_thumbnail_image(path)
+
+        jpeg_path, png_path = thumbnail_cache_paths(path)
+        assert jpeg_path.read_bytes()[:2] == b"\xff\xd8"
+        assert not png_path.exists()
+
+    def test_transparent_thumbnail_cached_as_png(self, qapp, tmp_path):
+        """Test that thumbnails with transparency keep their alpha channel."""
+        path = tmp_path / "source.png"
+        Image.new("RGBA", (400, 400), (255, 0, 0, 128)).save(path, "PNG")
+
+        load_thumbnail_image(path)
+        image = load_thumbnail_image(path)
+
+        jpeg_path, png_path = thumbnail_cache_paths(path)
+        assert png_path.exists()
+        assert not jpeg_path.exists()
+        assert image.hasAlphaChannel()
+
+    def test_disk_cache_leaves_no_temporary_files(self, qapp, tmp_path, thumbnail_cache_dir):
+        """Test that thumbnails are renamed into place after writing."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+
+        load_thumbnail_image(path)
+
+        assert [p.name for p in thumbnail_cache_dir.iterdir()] == [thumbnail_cache_paths(path)[0].name]
+
+    def test_cached_thumbnail_skips_decode(self, qapp, tmp_path, mocker):
+        """Test that a cached thumbnail is loaded without decoding the source."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+        load_thumbnail_image(path)
+
+        decode = mocker.patch.object(thumbnails, "decode_thumbnail_image")
+        image = load_thumbnail_image(path)
+
+        decode.assert_not_called()
+        assert image.width() == THUMBNAIL_SIZE
+
+    def test_given_stat_is_used_for_cache_key(self, qapp, tmp_path, mocker):
+        """Test that a stat result from the caller avoids another stat()."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+        stat = path.stat()
+        expected = thumbnail_cache_paths(path)
+
+        mock_stat = mocker.patch.object(thumbnails.os, "stat")
+
+        assert thumbnail_cache_paths(path, stat=stat) == expected
+        mock_stat.assert_not_called()
+
+    def test_cache_key_changes_with_source(self, qapp, tmp_path):
+        """Test that rewriting the source invalidates the cached thumbnail."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+        before = thumbnail_cache_paths(path)
+
+        Image.new("RGB", (300, 600)).save(path, "PNG")
+
+        assert thumbnail_cache_paths(path) != before
+
+
+@pytest.mark.ui
+class TestThumbnailDiskCache:
+    """Tests for bounding and invalidating the thumbnail disk cache."""
+
+    def test_prune_removes_least_recently_used(self, thumbnail_cache_dir):
+        """Test that the oldest entries go first once over the cap."""
+        oldest = _write_entry(thumbnail_cache_dir, "a.jpg", 100, 1000)
+        middle = _write_entry(thumbnail_cache_dir, "b.jpg", 100, 2000)
+        newest = _write_entry(thumbnail_cache_dir, "c.jpg", 100, 3000)
+
+        remaining = prune_thumbnail_cache(max_bytes=250)
+
+        assert remaining == 200
+        assert not oldest.exists()
+        assert middle.exists() and newest.exists()
+
+    def test_prune_keeps_cache_under_cap(self, thumbnail_cache_dir):
+        """Test that a cache within the cap is left untouched."""
+        entry = _write_entry(thumbnail_cache_dir, "a.jpg", 100, 1000)
+
+        assert prune_thumbnail_cache(max_bytes=100) == 100
+        assert entry.exists()
+
+    def test_prune_skips_writes_in_progress(self, thumbnail_cache_dir):
+        """Test that temporary files of concurrent writes are not removed."""
+        pending = _write_entry(thumbnail_cache_dir, "a.jpg.1234.tmp", 100, 1000)
+        _write_entry(thumbnail_cache_dir, "b.jpg", 100, 2000)
+
+        prune_thumbnail_cache(max_bytes=0)
+
+        assert pending.exists()
+
+    def test_cache_hit_refreshes_entry(self, qapp, tmp_path):
+        """Test that reading a cached thumbnail marks it recently used."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+        load_thumbnail_image(path)
+        cache_path = thumbnail_cache_paths(path)[0]
+        os.utime(cache_path, (1000, 1000))
+
+        load_thumbnail_image(path)
+
+        assert cache_path.stat().st_mtime > 1000
+
+    def test_writes_prune_cache_over_cap(self, qapp, tmp_path, thumbnail_cache_dir, monkeypatch):
+        """Test that writing past the cap evicts older thumbnails."""
+        stale = _write_entry(thumbnail_cache_dir, "stale.jpg", 4096, 1000)
+        monkeypatch.setattr(thumbnails, "THUMBNAIL_CACHE_MAX_BYTES", 4096)
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+
+        load_thumbnail_image(path)
+
+        assert not stale.exists()
+        assert thumbnail_cache_paths(path)[0].exists()
+
+    def test_remove_cached_thumbnail(self, qapp, tmp_path):
+        """Test that a source's cached thumbnail can be dropped."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+        load_thumbnail_image(path)
+
+        remove_cached_thumbnail(path)
+
+        assert not any(p.exists() for p in thumbnail_cache_paths(path))
+
+    def test_remove_cached_thumbnail_of_missing_source(self, tmp_path):
+        """Test that a source that no longer exists is ignored."""
+        remove_cached_thumbnail(tmp_path / "missing.png")
+
+
+@pytest.mark.ui
+class TestThumbnailLoader:
+    """Tests for ThumbnailLoader."""
+
+    def test_run_emits_loaded_thumbnail(self, qapp, tmp_path):
+        """Test that the loader delivers the thumbnail with its source path."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+        received = []
+
+        loader = ThumbnailLoader(path)
+        loader.signals.loaded.connect(lambda p, image: received.append((p, image)))
+        loader.run()
+
+        assert len(received) == 1
+        assert received[0][0] == str(path)
+        assert received[0][1].width() == THUMBNAIL_SIZE
+
+    def test_cancelled_loader_skips_decode(self, qapp, tmp_path, mocker):
+        """Test that a loader cancelled before running does no work."""
+        path = tmp_path / "source.png"
+        Image.new("RGB", (400, 400)).save(path, "PNG")
+        load = mocker.patch.object(thumbnails, "load_thumbnail_image")
+        received = []
+
+        loader = ThumbnailLoader(path)
+        loader.signals.loaded.connect(lambda p, image: received.append(p))
+        loader.cancelled.set()
+        loader.run()
+
+        load.assert_not_called()
+        assert received == []
+
+
+class TestThumbnailPixmapKey:
+    """Tests for thumbnail_pixmap_key."""
+
+    def test_key_includes_mtime_and_size(self):
+        """Test that rewritten files and other sizes get distinct keys."""
+        key = thumbnail_pixmap_key("/tmp/a.png", 1)
+
+        assert key == f"/tmp/a.png:1:{THUMBNAIL_SIZE}"
+        assert key != thumbnail_pixmap_key("/tmp/a.png", 2)
+        assert key != thumbnail_pixmap_key("/tmp/a.png", 1, size=100)
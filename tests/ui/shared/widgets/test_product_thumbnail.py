@@ -0,0 +1,53 @@
+"""Tests for the ProductThumbnail widget."""
+import pytest
+from datetime import datetime
+
+from PIL import Image
+from PyQt6.QtGui import QImage
+
+from imagen_desktop.core.models.product import Product, ProductType
+from imagen_desktop.ui.shared.widgets.product_thumbnail import ProductThumbnail
+
+
+@pytest.fixture
+def product(tmp_path):
+    """Create a product backed by a real image file."""
+    path = tmp_path / "product.png"
+    Image.new("RGB", (32, 32)).save(path, "PNG")
+    return Product(
+        id=1,
+        file_path=path,
+        product_type=ProductType.IMAGE,
+        generation_id="gen1",
+        created_at=datetime(2025, 5, 17, 12, 0, 0)
+    )
+
+
+@pytest.mark.ui
+class TestProductThumbnail:
+    """Test suite for ProductThumbnail."""
+
+    def test_released_thumbnail_ignores_late_image(self, qtbot, product, mocker):
+        """Test that a decode finishing after release doesn't show its pixmap."""
+        mocker.patch("imagen_desktop.ui.shared.widgets.product_thumbnail.QThreadPool")
+        thumbnail = ProductThumbnail(product, lazy=True)
+        qtbot.addWidget(thumbnail)
+
+        thumbnail.load_thumbnail()
+        thumbnail.release_thumbnail()
+        image = QImage(16, 16, QImage.Format.Format_RGB32)
+        thumbnail._apply_thumbnail(str(product.file_path), image)
+
+        assert thumbnail.pixmap().isNull()
+
+    def test_requested_thumbnail_shows_image(self, qtbot, product, mocker):
+        """Test that a delivered image is shown while the thumbnail is wanted."""
+        mocker.patch("imagen_desktop.ui.shared.widgets.product_thumbnail.QThreadPool")
+        thumbnail = ProductThumbnail(product, lazy=True)
+        qtbot.addWidget(thumbnail)
+
+        thumbnail.load_thumbnail()
+        image = QImage(16, 16, QImage.Format.Format_RGB32)
+        thumbnail._apply_thumbnail(str(product.file_path), image)
+
+        assert not thumbnail.pixmap().isNull()
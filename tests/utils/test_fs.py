@@ -0,0 +1,67 @@
+"""Tests for bulk filesystem helpers."""
+import os
+
+from imagen_desktop.utils.fs import directory_signature, existing_paths
+
+
+class TestExistingPaths:
+    """Test suite for existing_paths."""
+    
+    def test_returns_only_existing_paths(self, tmp_path):
+        """Test that missing files are filtered out."""
+        present = tmp_path / "present.png"
+        present.write_bytes(b"data")
+        
+        result = existing_paths([present, tmp_path / "missing.png"])
+        
+        assert result == {present}
+    
+    def test_handles_several_directories(self, tmp_path):
+        """Test paths spread across directories."""
+        first = tmp_path / "a" / "one.png"
+        second = tmp_path / "b" / "two.png"
+        for path in (first, second):
+            path.parent.mkdir()
+            path.write_bytes(b"data")
+        
+        assert existing_paths([first, second]) == {first, second}
+    
+    def test_returns_caller_objects_for_strings(self, tmp_path):
+        """Test that string paths come back as the same strings."""
+        present = tmp_path / "present.png"
+        present.write_bytes(b"data")
+        
+        result = existing_paths([str(present), str(tmp_path / "missing.png")])
+        
+        assert result == {str(present)}
+    
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing parent directory yields no paths."""
+        assert existing_paths([tmp_path / "nowhere" / "file.png"]) == set()
+
+
+class TestDirectorySignature:
+    """Test suite for directory_signature."""
+    
+    def test_unchanged_directory_gives_same_signature(self, tmp_path):
+        """Test that repeated calls agree when nothing changed."""
+        path = tmp_path / "image.png"
+        path.write_bytes(b"data")
+        
+        assert directory_signature([path]) == directory_signature([str(path)])
+    
+    def test_added_file_changes_signature(self, tmp_path):
+        """Test that adding a file to the directory changes the signature."""
+        path = tmp_path / "image.png"
+        path.write_bytes(b"data")
+        os.utime(tmp_path, ns=(0, 0))
+        before = directory_signature([path])
+        (tmp_path / "other.png").write_bytes(b"data")
+        
+        assert directory_signature([path]) != before
+    
+    def test_missing_directory(self, tmp_path):
+        """Test that unreadable directories are reported without mtime."""
+        missing = tmp_path / "nowhere"
+        
+        assert directory_signature([missing / "file.png"]) == ((str(missing), None),)
@@ -0,0 +1,68 @@
+"""Tests for image metadata probing."""
+import io
+
+from PIL import Image
+
+from imagen_desktop.utils.image_probe import ImageMeta, probe_image, probe_png_header
+
+
+class TestProbeImage:
+    """Test suite for probe_image."""
+    
+    def test_probe_image_from_path(self, tmp_path):
+        """Test reading size and format from a file."""
+        path = tmp_path / "image.png"
+        Image.new("RGB", (64, 32)).save(path, "PNG")
+        
+        assert probe_image(path) == ImageMeta(64, 32, "png")
+    
+    def test_probe_image_reports_actual_format(self, tmp_path):
+        """Test that the format comes from the data, not the suffix."""
+        path = tmp_path / "image.png"
+        Image.new("RGB", (16, 16)).save(path, "JPEG")
+        
+        assert probe_image(path).format == "jpeg"
+    
+    def test_probe_image_from_file_object(self):
+        """Test reading size and format from an in-memory buffer."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 4)).save(buffer, "PNG")
+        buffer.seek(0)
+        
+        assert probe_image(buffer) == ImageMeta(8, 4, "png")
+    
+    def test_probe_image_invalid_data(self, tmp_path):
+        """Test that unreadable files yield empty metadata."""
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"not an image")
+        
+        assert probe_image(path) == ImageMeta()
+    
+    def test_probe_image_leaves_file_object_position(self):
+        """Test that probing a PNG buffer doesn't consume it."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 4)).save(buffer, "PNG")
+        buffer.seek(0)
+        
+        probe_image(buffer)
+        
+        assert buffer.tell() == 0
+
+
+class TestProbePngHeader:
+    """Test suite for probe_png_header."""
+    
+    def test_reads_dimensions_from_header(self):
+        """Test that width and height come from the IHDR chunk."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (300, 200)).save(buffer, "PNG")
+        
+        assert probe_png_header(buffer.getvalue()[:24]) == ImageMeta(300, 200, "png")
+    
+    def test_rejects_other_formats(self):
+        """Test that non-PNG data is left to the general probe."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (16, 16)).save(buffer, "JPEG")
+        
+        assert probe_png_header(buffer.getvalue()) is None
+        assert probe_png_header(b"\x89PNG") is None
@@ -0,0 +1,85 @@
+"""Tests for the on-disk model listing cache."""
+import os
+import time
+
+import pytest
+
+from imagen_desktop.utils import model_cache
+from imagen_desktop.utils.model_cache import (
+    has_cached_models, is_cache_stale, is_listing_unchanged, load_cached_models,
+    save_cached_models, touch_cached_models
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the model cache at a temporary directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(model_cache, "MODEL_CACHE_DIR", directory)
+    return directory
+
+
+class TestModelCache:
+    """Test suite for the model cache."""
+    
+    def test_round_trip(self):
+        """Test that saved models load back unchanged."""
+        models = [{'name': 'flux', 'owner': 'bfl', 'identifier': 'bfl/flux'}]
+        
+        save_cached_models("text-to-image", models)
+        
+        assert load_cached_models("text-to-image") == models
+    
+    def test_missing_cache(self):
+        """Test that an absent cache loads as None and is stale."""
+        assert load_cached_models("text-to-image") is None
+        assert is_cache_stale("text-to-image")
+        assert not has_cached_models("text-to-image")
+        
+        save_cached_models("text-to-image", [])
+        assert has_cached_models("text-to-image")
+    
+    def test_corrupt_cache_is_ignored(self, cache_dir):
+        """Test that unreadable cache files load as None."""
+        cache_dir.mkdir()
+        (cache_dir / "models-text-to-image.json").write_text("{not json")
+        
+        assert load_cached_models("text-to-image") is None
+    
+    def test_staleness_follows_ttl(self, cache_dir):
+        """Test that the cache goes stale once older than the TTL."""
+        save_cached_models("text-to-image", [])
+        assert not is_cache_stale("text-to-image", ttl=60)
+        
+        old = time.time() - 120
+        os.utime(cache_dir / "models-text-to-image.json", (old, old))
+        
+        assert is_cache_stale("text-to-image", ttl=60)
+    
+    def test_save_leaves_no_temporary_files(self, cache_dir):
+        """Test that the listing is renamed into place after writing."""
+        save_cached_models("text-to-image", [])
+        
+        assert [p.name for p in cache_dir.iterdir()] == ["models-text-to-image.json"]
+    
+    def test_detects_unchanged_listing(self):
+        """Test that a listing is compared against the cached one."""
+        models = [{'name': 'flux', 'owner': 'bfl', 'identifier': 'bfl/flux'}]
+        assert not is_listing_unchanged("text-to-image", models)
+        
+        save_cached_models("text-to-image", models)
+        
+        assert is_listing_unchanged("text-to-image", list(models))
+        assert not is_listing_unchanged("text-to-image", [])
+    
+    def test_touch_restarts_ttl(self, cache_dir):
+        """Test that touching a cached listing restarts its TTL."""
+        models = [{'name': 'flux', 'owner': 'bfl', 'identifier': 'bfl/flux'}]
+        save_cached_models("text-to-image", models)
+        old = time.time() - 120
+        os.utime(cache_dir / "models-text-to-image.json", (old, old))
+        
+        touch_cached_models("text-to-image")
+        
+        assert not is_cache_stale("text-to-image", ttl=60)
+        assert load_cached_models("text-to-image") == models